@@ -1,25 +1,42 @@
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Header, Query, Response, WebSocket, WebSocketDisconnect, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, EmailStr
-from typing import List, Dict, Optional, Annotated
+from typing import List, Dict, Literal, Optional, Tuple, Annotated
+from collections import defaultdict
+from dataclasses import dataclass
 import uuid
 from datetime import datetime, timedelta
 import os
+import math
+import time
+import logging
+import asyncio
+import hashlib
 import jwt
 import bcrypt
-from pymongo import MongoClient
+import numpy as np
+import orjson
+from functools import lru_cache
+from cachetools import TTLCache
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 from motor.motor_asyncio import AsyncIOMotorClient
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # CORS configuration
+# Credentialed requests can't use a "*" origin, so list origins explicitly (comma-separated)
+CORS_ORIGINS = [origin.strip() for origin in os.environ.get('CORS_ORIGINS', 'http://localhost:3000').split(',') if origin.strip()]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,  # Let browsers cache preflights for a day
 )
 
 # Database configuration
@@ -28,24 +45,83 @@ DB_NAME = os.environ.get('DB_NAME', 'poker_league_db')
 
 # JWT configuration
 JWT_SECRET = "your-secret-key-change-in-production"
+JWT_SECRET_BYTES = JWT_SECRET.encode('utf-8')  # Encoded once instead of on every sign/verify
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
 
-# MongoDB client
-client = AsyncIOMotorClient(MONGO_URL)
+# Auth cache configuration
+AUTH_CACHE_TTL_SECONDS = 30
+AUTH_CACHE_MAX_SIZE = 10000
+
+# Password hashing configuration
+# BCRYPT_ROUNDS pins the cost; when unset it is calibrated at startup to take ~BCRYPT_TARGET_MS per hash
+BCRYPT_ROUNDS_OVERRIDE = os.environ.get('BCRYPT_ROUNDS')
+BCRYPT_ROUNDS = int(BCRYPT_ROUNDS_OVERRIDE) if BCRYPT_ROUNDS_OVERRIDE else 10
+BCRYPT_TARGET_MS = float(os.environ.get('BCRYPT_TARGET_MS', '250'))
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 14
+
+logger = logging.getLogger(__name__)
+
+# MongoDB client: one shared client per process (each uvicorn worker gets its own pool)
+client = AsyncIOMotorClient(
+    MONGO_URL,
+    maxPoolSize=50,
+    minPoolSize=10,
+    maxIdleTimeMS=60000,
+    serverSelectionTimeoutMS=3000,
+    retryWrites=True,
+    uuidRepresentation="standard"
+)
 db = client[DB_NAME]
 
 # Security
 security = HTTPBearer()
 
+# Verified tokens -> (user doc, expires_at), so repeat requests skip jwt.decode and the user lookup
+_auth_cache = TTLCache(maxsize=AUTH_CACHE_MAX_SIZE, ttl=AUTH_CACHE_TTL_SECONDS)
+
+# Per-league locks serializing read-modify-write updates to the active game document
+_game_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+# Per-league status feeds for connected /api/ws/game streams (process-local, like the locks):
+# each league's sockets -> (user id, last body sent), the event that wakes its feed, and the feed task
+_game_sockets: Dict[str, Dict[WebSocket, Tuple[str, Optional[str]]]] = defaultdict(dict)
+_game_changed: Dict[str, asyncio.Event] = {}
+_game_feeds: Dict[str, asyncio.Task] = {}
+GAME_PUSH_RESYNC_SECONDS = 15
+
+# Projections: fetch only the fields callers actually read
+USER_PUBLIC_PROJECTION = {"id": 1, "email": 1, "name": 1, "avatar": 1, "_id": 0}
+GAME_STATUS_PROJECTION = {
+    "id": 1,
+    "checked_in_users": 1,
+    "eliminated_users": 1,
+    "initial_players": 1,
+    "game_started": 1,
+    "game_completed": 1,
+    "_id": 0
+}
+LEAGUE_FIELDS = (
+    "id", "name", "buy_in", "max_players", "game_format",
+    "description", "admin_id", "admin_name", "created_at"
+)
+
 # Collections
 users_collection = db.users
 leagues_collection = db.leagues
 memberships_collection = db.memberships
 games_collection = db.games
 game_results_collection = db.game_results
+# Precomputed per-user standings, one row per (scope, user_id); scope is "global" or a league id
+leaderboard_collection = db.leaderboard
+LEADERBOARD_GLOBAL_SCOPE = "global"
+# Full rebuild interval, which bounds how long a row left stale by racing refreshes survives (0 disables)
+LEADERBOARD_REBUILD_SECONDS = float(os.environ.get('LEADERBOARD_REBUILD_SECONDS', '3600'))
+_leaderboard_rebuilder: Optional[asyncio.Task] = None
 
 # Models
+# Request bodies are Pydantic models (validated); internal/response shapes are slotted dataclasses
 class UserCreate(BaseModel):
     email: EmailStr
     password: str
@@ -55,7 +131,8 @@ class UserLogin(BaseModel):
     email: EmailStr
     password: str
 
-class User(BaseModel):
+@dataclass(slots=True)
+class User:
     id: str
     email: str
     name: str
@@ -69,7 +146,8 @@ class LeagueCreate(BaseModel):
     game_format: str
     description: Optional[str] = ""
 
-class League(BaseModel):
+@dataclass(slots=True)
+class League:
     id: str
     name: str
     buy_in: int
@@ -86,7 +164,7 @@ class JoinLeagueRequest(BaseModel):
 
 class CheckInRequest(BaseModel):
     league_id: str
-    action: str  # "check_in" or "check_out"
+    action: Literal["check_in", "check_out"]
     finish_position: Optional[int] = None  # For when checking out with score
 
 class GameResult(BaseModel):
@@ -99,14 +177,16 @@ class GameResult(BaseModel):
 class GameResultSubmission(BaseModel):
     results: List[GameResult]
 
-class SeatAssignment(BaseModel):
+@dataclass(slots=True)
+class SeatAssignment:
     table_number: int
     seat_number: int
     user_id: str
     user_name: str
     user_avatar: str
 
-class LeaderboardEntry(BaseModel):
+@dataclass(slots=True)
+class LeaderboardEntry:
     user_id: str
     user_name: str
     user_avatar: str
@@ -118,7 +198,8 @@ class LeaderboardEntry(BaseModel):
     total_earnings: int
     rank: int
 
-class LiveElimination(BaseModel):
+@dataclass(slots=True)
+class LiveElimination:
     user_id: str
     user_name: str
     user_avatar: str
@@ -127,55 +208,96 @@ class LiveElimination(BaseModel):
     eliminated_at: datetime
 
 # JWT helper functions
-def create_access_token(user_id: str, email: str) -> str:
+def create_access_token(user_id: str, email: str, name: str, avatar: str) -> str:
     expire = datetime.utcnow() + timedelta(hours=JWT_EXPIRATION_HOURS)
+    # Carry the public profile so authenticated requests don't need a user lookup
     payload = {
         "user_id": user_id,
         "email": email,
+        "name": name,
+        "avatar": avatar,
         "exp": expire
     }
-    return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    return jwt.encode(payload, JWT_SECRET_BYTES, algorithm=JWT_ALGORITHM)
 
 def verify_token(token: str) -> dict:
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = jwt.decode(token, JWT_SECRET_BYTES, algorithms=[JWT_ALGORITHM])
         return payload
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired")
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-async def get_current_user(credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)]) -> dict:
-    token = credentials.credentials
+def _auth_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()[:32]
+
+async def resolve_user(token: str) -> dict:
+    """Map a bearer token to its public user document, via the short-lived auth cache"""
+    cache_key = _auth_cache_key(token)
+    
+    cached = _auth_cache.get(cache_key)
+    if cached:
+        user, expires_at = cached
+        if time.time() < expires_at:
+            return user
+        _auth_cache.pop(cache_key, None)
+    
     payload = verify_token(token)
-    user = await users_collection.find_one({"id": payload["user_id"]})
-    if not user:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    if "name" in payload and "avatar" in payload:
+        user = {
+            "id": payload["user_id"],
+            "email": payload["email"],
+            "name": payload["name"],
+            "avatar": payload["avatar"]
+        }
+    else:
+        # Tokens issued before the profile was embedded still resolve through the database
+        user = await users_collection.find_one({"id": payload["user_id"]}, USER_PUBLIC_PROJECTION)
+        if not user:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    
+    # Never serve a cached user past the token's own expiry
+    expires_at = min(time.time() + AUTH_CACHE_TTL_SECONDS, payload["exp"])
+    _auth_cache[cache_key] = (user, expires_at)
     return user
 
+async def get_current_user(credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)]) -> dict:
+    return await resolve_user(credentials.credentials)
+
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode('utf-8')
 
 def verify_password(password: str, hashed: str) -> bool:
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
 
+# bcrypt is pure CPU, so run it in the default threadpool instead of stalling the event loop
+async def hash_password_async(password: str) -> str:
+    return await asyncio.to_thread(hash_password, password)
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    return await asyncio.to_thread(verify_password, password, hashed)
+
+def _new_id() -> str:
+    """New document id: a uuid4 as 32 hex chars (no dashes)"""
+    return uuid.uuid4().hex
+
+# Avatars handed out at registration, picked by name length
+_AVATARS = ("🎯", "♠️", "♥️", "♣️", "♦️", "🃏", "🎰", "🎲", "🎪", "🎨", "🎭", "🎸", "🎵", "🎺", "🎻")
+_N_AVATARS = len(_AVATARS)
+
+# Points by finish position: 1st=100, 2nd=80, 3rd=60, 4th-5th=40, 6th-8th=20, beyond that 10.
+# Index 0 (and anything below it) keeps the old "<= 5" bucket of 40.
+_POINTS = (40, 100, 80, 60, 40, 40, 20, 20, 20)
+
 def calculate_tournament_points(finish_position: int, total_players: int) -> int:
     """
     Calculate points based on finish position in tournament
     1st place gets 100 points, decreasing by position
     """
-    if finish_position == 1:
-        return 100
-    elif finish_position == 2:
-        return 80
-    elif finish_position == 3:
-        return 60
-    elif finish_position <= 5:
-        return 40
-    elif finish_position <= 8:
-        return 20
-    else:
+    if finish_position >= len(_POINTS):
         return 10
+    return _POINTS[max(finish_position, 0)]
 
 def calculate_prize_distribution(total_players: int, buy_in: int) -> Dict[int, int]:
     """
@@ -198,61 +320,51 @@ def calculate_prize_distribution(total_players: int, buy_in: int) -> Dict[int, i
             3: int(prize_pool * 0.2)
         }
 
-def calculate_seat_assignments(checked_in_users: List[dict]) -> List[SeatAssignment]:
+def _tables(num_players: int) -> int:
+    """Tables needed for num_players at max 9 per table (always at least one)"""
+    return 1 if num_players <= 9 else (num_players + 8) // 9
+
+@lru_cache(maxsize=64)
+def calculate_seat_assignments(checked_in_players: Tuple[Tuple[str, str, str], ...]) -> Tuple[dict, ...]:
     """
     Algorithm to assign seats optimally across tables
     - Maximum 9 players per table
     - Distribute players evenly across tables
-    - Return structured seat assignments
+    - Return seat assignments as plain dicts (SeatAssignment shape); inputs are trusted
+      internal data, so skip per-seat model validation
+    Players are pre-resolved (id, name, avatar) tuples so the seat loop does no dict lookups.
+    Memoized on the player tuple: repeated polls with an unchanged table skip the recompute,
+    and any check-in/out changes the key. The cached result is shared, so treat it as read-only.
     """
-    if not checked_in_users:
-        return []
+    if not checked_in_players:
+        return ()
     
-    num_players = len(checked_in_users)
-    num_tables = (num_players + 8) // 9  # Ceiling division for max 9 per table
+    num_players = len(checked_in_players)
+    num_tables = _tables(num_players)
     
-    # If we have more than 9 players, distribute evenly
-    if num_tables > 1:
-        players_per_table = num_players // num_tables
-        extra_players = num_players % num_tables
-    else:
-        players_per_table = num_players
-        extra_players = 0
-    
-    assignments = []
-    user_index = 0
+    # Spread players evenly; the first (num_players % num_tables) tables take one extra
+    table_sizes = np.full(num_tables, num_players // num_tables)
+    table_sizes[:num_players % num_tables] += 1
     
-    for table in range(1, num_tables + 1):
-        # Calculate how many players for this table
-        table_size = players_per_table + (1 if table <= extra_players else 0)
-        
-        # Assign seats for this table
-        for seat in range(1, table_size + 1):
-            if user_index < len(checked_in_users):
-                user = checked_in_users[user_index]
-                
-                assignments.append(SeatAssignment(
-                    table_number=table,
-                    seat_number=seat,
-                    user_id=user["id"],
-                    user_name=user["name"],
-                    user_avatar=user["avatar"]
-                ))
-                user_index += 1
-    
-    return assignments
-
-async def calculate_leaderboard(league_id: str = None) -> List[LeaderboardEntry]:
-    """
-    Calculate leaderboard for a specific league or overall
-    """
-    # Build query filter
-    query_filter = {}
-    if league_id:
-        query_filter["league_id"] = league_id
+    # Table and seat number for every player, computed as whole vectors rather than per seat
+    table_numbers = np.repeat(np.arange(1, num_tables + 1), table_sizes)
+    seat_numbers = np.arange(num_players) - np.repeat(np.cumsum(table_sizes) - table_sizes, table_sizes) + 1
     
-    # Aggregate player statistics
-    pipeline = [
+    return tuple(
+        {
+            "table_number": table,
+            "seat_number": seat,
+            "user_id": user_id,
+            "user_name": user_name,
+            "user_avatar": user_avatar
+        }
+        for table, seat, (user_id, user_name, user_avatar)
+        in zip(table_numbers.tolist(), seat_numbers.tolist(), checked_in_players)
+    )
+
+def _leaderboard_stats_pipeline(query_filter: dict) -> List[dict]:
+    """Per-user totals over the matching game results (the source of leaderboard rows)"""
+    return [
         {"$match": query_filter},
         {
             "$group": {
@@ -269,10 +381,20 @@ async def calculate_leaderboard(league_id: str = None) -> List[LeaderboardEntry]
                 "total_earnings": {"$sum": "$earnings"}
             }
         },
+        # Join each ranked user's avatar in the same round trip
+        {
+            "$lookup": {
+                "from": "users",
+                "localField": "_id",
+                "foreignField": "id",
+                "as": "user"
+            }
+        },
         {
             "$project": {
                 "_id": 1,
                 "user_name": 1,
+                "user_avatar": {"$ifNull": [{"$arrayElemAt": ["$user.avatar", 0]}, "🎯"]},
                 "total_points": 1,
                 "games_played": 1,
                 "wins": 1,
@@ -292,28 +414,108 @@ async def calculate_leaderboard(league_id: str = None) -> List[LeaderboardEntry]
                 },
                 "total_earnings": 1
             }
-        },
-        {"$sort": {"total_points": -1}}
+        }
     ]
+
+async def _write_leaderboard_scope(scope: str, query_filter: dict, user_ids: Optional[List[str]] = None):
+    """
+    Recompute leaderboard rows for one scope from game_results. With user_ids only
+    those users' rows are touched; without, the whole scope is rebuilt.
+    """
+    rows = await game_results_collection.aggregate(_leaderboard_stats_pipeline(query_filter)).to_list(None)
+    ranked_ids = [row["_id"] for row in rows]
+    
+    if rows:
+        now = datetime.utcnow()
+        await leaderboard_collection.bulk_write([
+            UpdateOne(
+                {"scope": scope, "user_id": row["_id"]},
+                {"$set": {
+                    "user_name": row["user_name"],
+                    "user_avatar": row["user_avatar"],
+                    "total_points": row["total_points"],
+                    "games_played": row["games_played"],
+                    "wins": row["wins"],
+                    "win_rate": row["win_rate"],
+                    "avg_finish": row["avg_finish"],
+                    "total_earnings": row["total_earnings"],
+                    "updated_at": now
+                }},
+                upsert=True
+            )
+            for row in rows
+        ], ordered=False)
+    
+    # Drop rows for users who no longer have any results in this scope
+    if user_ids is None:
+        stale_filter = {"scope": scope, "user_id": {"$nin": ranked_ids}}
+    else:
+        stale_filter = {"scope": scope, "user_id": {"$in": list(set(user_ids) - set(ranked_ids))}}
+    await leaderboard_collection.delete_many(stale_filter)
+
+async def refresh_leaderboard(league_id: str, user_ids: List[str]):
+    """
+    Bring the global and league leaderboard rows for these users up to date.
+    Rows are recomputed rather than incremented because complete_game replaces
+    the live elimination results, which would otherwise be counted twice.
+    """
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return
+    await asyncio.gather(
+        _write_leaderboard_scope(LEADERBOARD_GLOBAL_SCOPE, {"user_id": {"$in": user_ids}}, user_ids),
+        _write_leaderboard_scope(league_id, {"league_id": league_id, "user_id": {"$in": user_ids}}, user_ids)
+    )
+
+async def rebuild_leaderboard():
+    """Materialize every leaderboard scope from scratch"""
+    await _write_leaderboard_scope(LEADERBOARD_GLOBAL_SCOPE, {})
+    league_ids = await game_results_collection.distinct("league_id")
+    for league_id in league_ids:
+        await _write_leaderboard_scope(league_id, {"league_id": league_id})
+    # Scopes whose league has no results left
+    await leaderboard_collection.delete_many({"scope": {"$nin": [LEADERBOARD_GLOBAL_SCOPE, *league_ids]}})
+
+async def _rebuild_leaderboard_periodically():
+    """
+    Refreshes from two leagues recompute the same global row concurrently and the
+    last write wins even if it read older results, and a backfill cut short leaves
+    a non-empty collection that startup never rebuilds; both heal on the next pass.
+    """
+    while True:
+        await asyncio.sleep(LEADERBOARD_REBUILD_SECONDS)
+        try:
+            await rebuild_leaderboard()
+        except BulkWriteError:
+            # Another worker's rebuild upserted the same new row first, from the same results
+            pass
+        except Exception:
+            logger.exception("Scheduled leaderboard rebuild failed; retrying in %.0fs", LEADERBOARD_REBUILD_SECONDS)
+
+async def calculate_leaderboard(league_id: str = None, limit: Optional[int] = None) -> List[LeaderboardEntry]:
+    """
+    Read the materialized leaderboard for a specific league or overall, optionally only the top limit rows
+    """
+    scope = league_id or LEADERBOARD_GLOBAL_SCOPE
+    rows = await leaderboard_collection.find(
+        {"scope": scope},
+        {"scope": 0, "updated_at": 0, "_id": 0}
+    ).sort("total_points", -1).limit(limit or 0).to_list(limit)
     
     leaderboard = []
     rank = 1
     
-    async for result in game_results_collection.aggregate(pipeline):
-        # Get user avatar
-        user = await users_collection.find_one({"id": result["_id"]})
-        user_avatar = user["avatar"] if user else "🎯"
-        
+    for row in rows:
         entry = LeaderboardEntry(
-            user_id=result["_id"],
-            user_name=result["user_name"],
-            user_avatar=user_avatar,
-            total_points=result["total_points"],
-            games_played=result["games_played"],
-            wins=result["wins"],
-            win_rate=round(result["win_rate"] * 100, 1),
-            avg_finish=round(result["avg_finish"], 1),
-            total_earnings=result["total_earnings"],
+            user_id=row["user_id"],
+            user_name=row["user_name"],
+            user_avatar=row["user_avatar"],
+            total_points=row["total_points"],
+            games_played=row["games_played"],
+            wins=row["wins"],
+            win_rate=round(row["win_rate"] * 100, 1),
+            avg_finish=round(row["avg_finish"], 1),
+            total_earnings=row["total_earnings"],
             rank=rank
         )
         leaderboard.append(entry)
@@ -326,40 +528,246 @@ async def get_active_game_players_count(league_id: str) -> int:
     current_game = await games_collection.find_one({
         "league_id": league_id,
         "status": "active"
-    })
+    }, {"game_started": 1, "initial_players": 1, "_id": 0})
     
     if not current_game or not current_game.get("game_started", False):
         return 0
     
     return len(current_game.get("initial_players", []))
 
+async def get_or_create_active_game(league_id: str, projection: Optional[dict] = None) -> dict:
+    """
+    Return the league's active game, creating an empty one if there is none.
+    The upsert plus the partial unique index on active games means concurrent
+    requests on any worker converge on a single active game.
+    """
+    active_game_filter = {"league_id": league_id, "status": "active"}
+    try:
+        return await games_collection.find_one_and_update(
+            active_game_filter,
+            {"$setOnInsert": {
+                "id": _new_id(),
+                "checked_in_users": [],
+                "eliminated_users": [],
+                "initial_players": [],
+                "seat_assignments": [],
+                "game_started": False,
+                "created_at": datetime.utcnow()
+            }},
+            projection=projection,
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        # Another worker inserted the active game between our match and insert
+        return await games_collection.find_one(active_game_filter, projection)
+
+def _notify_game_subscribers(league_id: str):
+    """Wake this league's status feed, if any socket is watching; a pending wake-up covers any new change"""
+    changed = _game_changed.get(league_id)
+    if changed is not None:
+        changed.set()
+
+def _if_none_match_hits(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Weak comparison against an If-None-Match list: "*" matches anything, and W/ prefixes
+    are ignored, since compressing proxies weaken the strong tags we send.
+    """
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+def etag_json_response(payload, if_none_match: Optional[str] = None) -> Response:
+    """
+    Serialize payload once and tag it with a content hash. Pollers that send the
+    tag back in If-None-Match get a bodiless 304 while nothing has changed.
+    """
+    body = orjson.dumps(payload)
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    if _if_none_match_hits(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
+
+def _member_count_lookup() -> List[dict]:
+    """Pipeline stages that attach an approved member_count to each league document"""
+    return [
+        {
+            "$lookup": {
+                "from": "memberships",
+                "let": {"lid": "$id"},
+                "pipeline": [
+                    {"$match": {"$expr": {"$and": [
+                        {"$eq": ["$league_id", "$$lid"]},
+                        {"$eq": ["$status", "approved"]}
+                    ]}}},
+                    {"$count": "n"}
+                ],
+                "as": "_mc"
+            }
+        },
+        {"$project": {
+            **{field: 1 for field in LEAGUE_FIELDS},
+            "member_count": {"$ifNull": [{"$arrayElemAt": ["$_mc.n", 0]}, 0]},
+            "_id": 0
+        }}
+    ]
+
+# Startup
+# Cross-worker constraints whose unique index couldn't be built over existing data, reported by /api/health
+_unenforced_constraints: Dict[str, str] = {}
+
+def _constraint_unenforced(name: str, reason: str):
+    logger.error("%s is not enforced: %s", name, reason)
+    _unenforced_constraints[name] = reason
+
+async def _ensure_unique_finish_position_index():
+    """One result per finish position per game, enforced by Mongo so it holds across workers"""
+    keys = [("game_id", 1), ("finish_position", 1)]
+    name = "game_id_1_finish_position_1"
+    try:
+        await game_results_collection.create_index(keys, unique=True, name=name)
+    except DuplicateKeyError:
+        # Old data already repeats a position; keep the lookups fast and leave the cleanup to an operator.
+        # Without the unique index the check-in rollback only guards against this worker's own racers
+        await game_results_collection.create_index(keys, name=name)
+        _constraint_unenforced(name, "game_results has duplicate (game_id, finish_position) rows")
+
+async def _ensure_one_active_game_per_league():
+    """At most one active game per league, enforced by Mongo so it holds across workers"""
+    # The unguarded get-or-create could race and leave several active games; keep each league's newest
+    duplicates = await games_collection.aggregate([
+        {"$match": {"status": "active"}},
+        {"$sort": {"created_at": -1}},
+        {"$group": {"_id": "$league_id", "game_ids": {"$push": "$id"}, "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}}
+    ]).to_list(None)
+    stale_ids = [game_id for league in duplicates for game_id in league["game_ids"][1:]]
+    if stale_ids:
+        logger.warning("Completing %d duplicate active games across %d leagues", len(stale_ids), len(duplicates))
+        await games_collection.update_many(
+            {"id": {"$in": stale_ids}, "status": "active"},
+            {"$set": {"status": "completed"}}
+        )
+    
+    name = "one_active_game_per_league"
+    try:
+        await games_collection.create_index(
+            "league_id",
+            unique=True,
+            partialFilterExpression={"status": "active"},
+            name=name
+        )
+    except DuplicateKeyError:
+        # A worker still running the old code created another one after the cleanup
+        _constraint_unenforced(name, "games has leagues with more than one active game")
+
+@app.on_event("startup")
+async def create_indexes():
+    """Index the predicates every hot endpoint filters on (create_index is a no-op if it exists)"""
+    await users_collection.create_index("email", unique=True)
+    await users_collection.create_index("id", unique=True)
+    await leagues_collection.create_index("id", unique=True)
+    await memberships_collection.create_index([("league_id", 1), ("status", 1), ("user_id", 1)])
+    await memberships_collection.create_index([("user_id", 1), ("status", 1)])
+    await games_collection.create_index([("league_id", 1), ("status", 1)])
+    await games_collection.create_index("id", unique=True)
+    # Recent games per user, per-league standings, and finish-position checks/status joins per game
+    await game_results_collection.create_index([("user_id", 1), ("created_at", -1)])
+    await game_results_collection.create_index([("league_id", 1), ("user_id", 1)])
+    await _ensure_unique_finish_position_index()
+    await _ensure_one_active_game_per_league()
+    await leaderboard_collection.create_index([("scope", 1), ("user_id", 1)], unique=True)
+    await leaderboard_collection.create_index([("scope", 1), ("total_points", -1)])
+
+@app.on_event("startup")
+async def calibrate_bcrypt_rounds():
+    """Pick the bcrypt cost whose hash time is closest to BCRYPT_TARGET_MS on this host"""
+    global BCRYPT_ROUNDS
+    if BCRYPT_ROUNDS_OVERRIDE:
+        logger.info("bcrypt rounds pinned to %d via BCRYPT_ROUNDS", BCRYPT_ROUNDS)
+        return
+    
+    started = time.perf_counter()
+    await asyncio.to_thread(bcrypt.hashpw, b"calibration", bcrypt.gensalt(rounds=BCRYPT_MIN_ROUNDS))
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    
+    # Each extra round doubles the work
+    rounds = BCRYPT_MIN_ROUNDS + round(math.log2(BCRYPT_TARGET_MS / max(elapsed_ms, 0.001)))
+    BCRYPT_ROUNDS = min(BCRYPT_MAX_ROUNDS, max(BCRYPT_MIN_ROUNDS, rounds))
+    logger.info(
+        "bcrypt calibrated to %d rounds (%.0fms at %d rounds, target %.0fms)",
+        BCRYPT_ROUNDS, elapsed_ms, BCRYPT_MIN_ROUNDS, BCRYPT_TARGET_MS
+    )
+
+@app.on_event("startup")
+async def backfill_leaderboard():
+    """Populate the materialized leaderboard on first boot after it was introduced"""
+    if await leaderboard_collection.estimated_document_count() > 0:
+        return
+    if await game_results_collection.estimated_document_count() == 0:
+        return
+    try:
+        await rebuild_leaderboard()
+    except BulkWriteError:
+        # Another worker is backfilling concurrently and won the upsert race
+        pass
+
+@app.on_event("startup")
+async def schedule_leaderboard_rebuild():
+    global _leaderboard_rebuilder
+    if LEADERBOARD_REBUILD_SECONDS > 0:
+        _leaderboard_rebuilder = asyncio.create_task(_rebuild_leaderboard_periodically())
+
+@app.on_event("shutdown")
+async def stop_leaderboard_rebuild():
+    if _leaderboard_rebuilder:
+        _leaderboard_rebuilder.cancel()
+
+# Health
+@app.get("/api/health")
+async def health():
+    """503 while a cross-worker constraint couldn't be enforced, so deploy checks and monitors notice"""
+    if _unenforced_constraints:
+        return ORJSONResponse(
+            status_code=503,
+            content={"status": "degraded", "unenforced_constraints": _unenforced_constraints}
+        )
+    return {"status": "ok"}
+
 # Auth endpoints
 @app.post("/api/auth/register")
 async def register(user_data: UserCreate):
     # Check if user already exists
-    existing_user = await users_collection.find_one({"email": user_data.email})
+    existing_user = await users_collection.find_one({"email": user_data.email}, {"_id": 1})
     if existing_user:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
     
     # Create new user
-    user_id = str(uuid.uuid4())
-    hashed_password = hash_password(user_data.password)
-    
-    avatars = ["🎯", "♠️", "♥️", "♣️", "♦️", "🃏", "🎰", "🎲", "🎪", "🎨", "🎭", "🎸", "🎵", "🎺", "🎻"]
+    user_id = _new_id()
+    hashed_password = await hash_password_async(user_data.password)
     
     new_user = {
         "id": user_id,
         "email": user_data.email,
         "password": hashed_password,
         "name": user_data.name,
-        "avatar": avatars[len(user_data.name) % len(avatars)],  # Simple avatar assignment
+        "avatar": _AVATARS[len(user_data.name) % _N_AVATARS],  # Simple avatar assignment
         "created_at": datetime.utcnow()
     }
     
     await users_collection.insert_one(new_user)
     
     # Create JWT token
-    token = create_access_token(user_id, user_data.email)
+    token = create_access_token(user_id, user_data.email, user_data.name, new_user["avatar"])
     
     return {
         "access_token": token,
@@ -374,11 +782,14 @@ async def register(user_data: UserCreate):
 
 @app.post("/api/auth/login")
 async def login(login_data: UserLogin):
-    user = await users_collection.find_one({"email": login_data.email})
-    if not user or not verify_password(login_data.password, user["password"]):
+    user = await users_collection.find_one(
+        {"email": login_data.email},
+        {**USER_PUBLIC_PROJECTION, "password": 1}
+    )
+    if not user or not await verify_password_async(login_data.password, user["password"]):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
     
-    token = create_access_token(user["id"], user["email"])
+    token = create_access_token(user["id"], user["email"], user["name"], user["avatar"])
     
     return {
         "access_token": token,
@@ -403,7 +814,7 @@ async def get_current_user_info(current_user: dict = Depends(get_current_user)):
 # League endpoints
 @app.post("/api/leagues")
 async def create_league(league_data: LeagueCreate, current_user: dict = Depends(get_current_user)):
-    league_id = str(uuid.uuid4())
+    league_id = _new_id()
     
     new_league = {
         "id": league_id,
@@ -421,7 +832,7 @@ async def create_league(league_data: LeagueCreate, current_user: dict = Depends(
     
     # Auto-join the creator as a member
     membership = {
-        "id": str(uuid.uuid4()),
+        "id": _new_id(),
         "league_id": league_id,
         "user_id": current_user["id"],
         "user_name": current_user["name"],
@@ -435,15 +846,9 @@ async def create_league(league_data: LeagueCreate, current_user: dict = Depends(
 
 @app.get("/api/leagues")
 async def get_leagues(current_user: dict = Depends(get_current_user)):
-    # Get all leagues with member counts
+    # Get all leagues with member counts in a single round trip
     leagues = []
-    async for league in leagues_collection.find():
-        # Count members for this league
-        member_count = await memberships_collection.count_documents({
-            "league_id": league["id"],
-            "status": "approved"
-        })
-        
+    for league in await leagues_collection.aggregate(_member_count_lookup()).to_list(None):
         league_data = {
             "id": league["id"],
             "name": league["name"],
@@ -454,7 +859,7 @@ async def get_leagues(current_user: dict = Depends(get_current_user)):
             "admin_id": league["admin_id"],
             "admin_name": league["admin_name"],
             "created_at": league["created_at"],
-            "member_count": member_count
+            "member_count": league["member_count"]
         }
         leagues.append(league_data)
     
@@ -462,40 +867,46 @@ async def get_leagues(current_user: dict = Depends(get_current_user)):
 
 @app.get("/api/leagues/my")
 async def get_my_leagues(current_user: dict = Depends(get_current_user)):
-    # Get leagues where user is a member
-    my_leagues = []
-    async for membership in memberships_collection.find({
-        "user_id": current_user["id"],
-        "status": "approved"
-    }):
-        league = await leagues_collection.find_one({"id": membership["league_id"]})
-        if league:
-            member_count = await memberships_collection.count_documents({
-                "league_id": league["id"],
-                "status": "approved"
-            })
-            
-            league_data = {
-                "id": league["id"],
-                "name": league["name"],
-                "buy_in": league["buy_in"],
-                "max_players": league["max_players"],
-                "game_format": league["game_format"],
-                "description": league["description"],
-                "admin_id": league["admin_id"],
-                "admin_name": league["admin_name"],
-                "created_at": league["created_at"],
-                "member_count": member_count,
-                "is_admin": league["admin_id"] == current_user["id"]
+    # Start from the user's memberships, then join in each league and its member count
+    pipeline = [
+        {"$match": {"user_id": current_user["id"], "status": "approved"}},
+        {"$project": {"league_id": 1, "_id": 0}},
+        {
+            "$lookup": {
+                "from": "leagues",
+                "localField": "league_id",
+                "foreignField": "id",
+                "as": "league"
             }
-            my_leagues.append(league_data)
+        },
+        {"$unwind": "$league"},
+        {"$replaceRoot": {"newRoot": "$league"}},
+        *_member_count_lookup()
+    ]
+    
+    my_leagues = []
+    for league in await memberships_collection.aggregate(pipeline).to_list(None):
+        league_data = {
+            "id": league["id"],
+            "name": league["name"],
+            "buy_in": league["buy_in"],
+            "max_players": league["max_players"],
+            "game_format": league["game_format"],
+            "description": league["description"],
+            "admin_id": league["admin_id"],
+            "admin_name": league["admin_name"],
+            "created_at": league["created_at"],
+            "member_count": league["member_count"],
+            "is_admin": league["admin_id"] == current_user["id"]
+        }
+        my_leagues.append(league_data)
     
     return my_leagues
 
 @app.post("/api/leagues/join")
 async def join_league(request: JoinLeagueRequest, current_user: dict = Depends(get_current_user)):
     # Check if league exists
-    league = await leagues_collection.find_one({"id": request.league_id})
+    league = await leagues_collection.find_one({"id": request.league_id}, {"max_players": 1, "_id": 0})
     if not league:
         raise HTTPException(status_code=404, detail="League not found")
     
@@ -503,7 +914,7 @@ async def join_league(request: JoinLeagueRequest, current_user: dict = Depends(g
     existing_membership = await memberships_collection.find_one({
         "league_id": request.league_id,
         "user_id": current_user["id"]
-    })
+    }, {"_id": 1})
     if existing_membership:
         raise HTTPException(status_code=400, detail="Already a member of this league")
     
@@ -517,7 +928,7 @@ async def join_league(request: JoinLeagueRequest, current_user: dict = Depends(g
     
     # Create membership
     membership = {
-        "id": str(uuid.uuid4()),
+        "id": _new_id(),
         "league_id": request.league_id,
         "user_id": current_user["id"],
         "user_name": current_user["name"],
@@ -526,54 +937,127 @@ async def join_league(request: JoinLeagueRequest, current_user: dict = Depends(g
         "joined_at": datetime.utcnow()
     }
     await memberships_collection.insert_one(membership)
+    _notify_game_subscribers(request.league_id)
     
     return {"message": "Successfully joined league"}
 
 # Game endpoints
-@app.get("/api/game/{league_id}/status")
-async def get_game_status(league_id: str, current_user: dict = Depends(get_current_user)):
+def _game_status_lookups(league_id: str) -> List[dict]:
+    """Pipeline stages that attach the league, its approved members and the active game with its results"""
+    return [
+        {
+            "$lookup": {
+                "from": "leagues",
+                "pipeline": [
+                    {"$match": {"id": league_id}},
+                    {"$limit": 1},
+                    {"$project": {"name": 1, "_id": 0}}
+                ],
+                "as": "league"
+            }
+        },
+        {
+            "$lookup": {
+                "from": "memberships",
+                "pipeline": [
+                    {"$match": {"league_id": league_id, "status": "approved"}},
+                    {"$project": {"user_id": 1, "user_name": 1, "user_avatar": 1, "_id": 0}}
+                ],
+                "as": "members"
+            }
+        },
+        {
+            "$lookup": {
+                "from": "games",
+                "pipeline": [
+                    {"$match": {"league_id": league_id, "status": "active"}},
+                    {"$limit": 1},
+                    {"$project": GAME_STATUS_PROJECTION},
+                    {
+                        "$lookup": {
+                            "from": "game_results",
+                            "let": {"gid": "$id"},
+                            "pipeline": [
+                                {"$match": {"$expr": {"$eq": ["$game_id", "$$gid"]}}},
+                                {"$sort": {"finish_position": 1}},
+                                {"$project": {
+                                    "user_id": 1,
+                                    "user_name": 1,
+                                    "user_avatar": 1,
+                                    "finish_position": 1,
+                                    "points_earned": 1,
+                                    "created_at": 1,
+                                    "_id": 0
+                                }}
+                            ],
+                            "as": "results"
+                        }
+                    }
+                ],
+                "as": "game"
+            }
+        }
+    ]
+
+async def build_game_status(league_id: str, user_id: str) -> dict:
+    """
+    Assemble the live game status for a league member (the polling endpoint);
+    raises 403 for non-members and 404 for a missing league.
+    """
+    # Fetch membership check, league, members, active game and its results in one round trip.
+    # Starting from the caller's own membership keeps the 403-before-404 ordering.
+    pipeline = [
+        {"$match": {
+            "league_id": league_id,
+            "user_id": user_id,
+            "status": "approved"
+        }},
+        {"$limit": 1},
+        {"$project": {"_id": 1}},
+        *_game_status_lookups(league_id)
+    ]
+    status_docs = await memberships_collection.aggregate(pipeline).to_list(1)
+    
     # Check if user is member of this league
-    membership = await memberships_collection.find_one({
-        "league_id": league_id,
-        "user_id": current_user["id"],
-        "status": "approved"
-    })
-    if not membership:
+    if not status_docs:
         raise HTTPException(status_code=403, detail="Not a member of this league")
-    
+    return await _assemble_game_status(league_id, status_docs[0])
+
+async def build_league_game_status(league_id: str) -> dict:
+    """
+    The same status without a membership check, built once per change by the league's
+    WebSocket feed; each socket's member is checked against league_members instead.
+    """
+    pipeline = [
+        {"$match": {"id": league_id}},
+        {"$limit": 1},
+        {"$project": {"_id": 1}},
+        *_game_status_lookups(league_id)
+    ]
+    status_docs = await leagues_collection.aggregate(pipeline).to_list(1)
+    if not status_docs:
+        raise HTTPException(status_code=404, detail="League not found")
+    return await _assemble_game_status(league_id, status_docs[0])
+
+async def _assemble_game_status(league_id: str, status_doc: dict) -> dict:
+    """Shape a status document from _game_status_lookups into the status payload"""
     # Get league info
-    league = await leagues_collection.find_one({"id": league_id})
-    if not league:
+    if not status_doc["league"]:
         raise HTTPException(status_code=404, detail="League not found")
+    league = status_doc["league"][0]
     
     # Get current game or create new one
-    current_game = await games_collection.find_one({
-        "league_id": league_id,
-        "status": "active"
-    })
-    
-    if not current_game:
+    if status_doc["game"]:
+        current_game = status_doc["game"][0]
+        game_results = current_game.pop("results")
+    else:
         # Create new game
-        game_id = str(uuid.uuid4())
-        current_game = {
-            "id": game_id,
-            "league_id": league_id,
-            "status": "active",
-            "checked_in_users": [],
-            "eliminated_users": [],
-            "initial_players": [],
-            "seat_assignments": [],
-            "game_started": False,
-            "created_at": datetime.utcnow()
-        }
-        await games_collection.insert_one(current_game)
+        current_game = await get_or_create_active_game(league_id, GAME_STATUS_PROJECTION)
+        game_results = []
     
     # Get all league members
     league_members = []
-    async for membership in memberships_collection.find({
-        "league_id": league_id,
-        "status": "approved"
-    }):
+    for membership in status_doc["members"]:
         league_members.append({
             "id": membership["user_id"],
             "name": membership["user_name"],
@@ -581,18 +1065,21 @@ async def get_game_status(league_id: str, current_user: dict = Depends(get_curre
         })
     
     # Get still-active players (checked in but not eliminated)
-    active_user_ids = [uid for uid in current_game["checked_in_users"] 
-                      if uid not in current_game.get("eliminated_users", [])]
-    active_users = [user for user in league_members if user["id"] in active_user_ids]
+    # Sets keep both membership tests O(1) instead of rescanning the lists per member
+    eliminated_user_ids = set(current_game.get("eliminated_users", []))
+    active_user_ids = set(current_game["checked_in_users"]) - eliminated_user_ids
+    active_count = len(active_user_ids)
+    active_players = tuple(
+        (user["id"], user["name"], user["avatar"])
+        for user in league_members if user["id"] in active_user_ids
+    )
     
     # Calculate current seat assignments for active players only
-    assignments = calculate_seat_assignments(active_users)
+    assignments = calculate_seat_assignments(active_players)
     
     # Get live eliminations
     eliminations = []
-    async for result in game_results_collection.find({
-        "game_id": current_game["id"]
-    }).sort("finish_position", 1):
+    for result in game_results:
         eliminations.append({
             "user_id": result["user_id"],
             "user_name": result["user_name"],
@@ -607,17 +1094,125 @@ async def get_game_status(league_id: str, current_user: dict = Depends(get_curre
         "league_id": league_id,
         "league_name": league["name"],
         "league_members": league_members,
-        "checked_in_players": len(active_user_ids),
+        "checked_in_players": active_count,
         "total_members": len(league_members),
         "total_initial_players": len(current_game.get("initial_players", [])),
-        "eliminated_count": len(current_game.get("eliminated_users", [])),
+        "eliminated_count": len(eliminated_user_ids),
         "seat_assignments": assignments,
         "game_started": current_game["game_started"],
         "game_completed": current_game.get("game_completed", False),
-        "tables_needed": max(1, (len(active_user_ids) + 8) // 9),
+        "tables_needed": _tables(active_count),
         "live_eliminations": eliminations
     }
 
+@app.get("/api/game/{league_id}/status")
+async def get_game_status(
+    league_id: str,
+    current_user: dict = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None)
+):
+    status_payload = await build_game_status(league_id, current_user["id"])
+    return etag_json_response(status_payload, if_none_match)
+
+async def _close_game_socket(league_id: str, websocket: WebSocket, code: int):
+    """Drop a socket from its league's feed and close it; the stream handler then sees the disconnect"""
+    _game_sockets[league_id].pop(websocket, None)
+    try:
+        await websocket.close(code=code)
+    except Exception:
+        pass  # Already gone
+
+async def _send_game_status(league_id: str, websocket: WebSocket, user_id: str, body: str):
+    try:
+        await websocket.send_text(body)
+    except Exception:
+        # The client went away; its handler cleans up on the disconnect
+        _game_sockets[league_id].pop(websocket, None)
+        return
+    if websocket in _game_sockets[league_id]:
+        _game_sockets[league_id][websocket] = (user_id, body)
+
+async def _run_game_feed(league_id: str):
+    """
+    Build the league's status once per change and fan it out to every connected socket, so a
+    check-in costs one aggregation however many members are watching. Sockets whose user is no
+    longer a member are closed with 1008; a failed build closes them all with 1011.
+    """
+    changed = _game_changed[league_id]
+    while True:
+        # Wake on a local change, or periodically to pick up writes handled by other workers
+        try:
+            await asyncio.wait_for(changed.wait(), GAME_PUSH_RESYNC_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        changed.clear()
+        
+        sockets = _game_sockets.get(league_id)
+        if not sockets:
+            # No await between this check and the cleanup, so a new socket can't slip in unseen
+            _game_sockets.pop(league_id, None)
+            del _game_changed[league_id]
+            del _game_feeds[league_id]
+            return
+        
+        try:
+            payload = await build_league_game_status(league_id)
+        except HTTPException:
+            # League gone mid-stream
+            code, body = status.WS_1008_POLICY_VIOLATION, None
+        except Exception:
+            # e.g. a Mongo timeout: close rather than leave clients connected with no more updates
+            logger.exception("Game status feed for league %s failed", league_id)
+            code, body = status.WS_1011_INTERNAL_ERROR, None
+        else:
+            member_ids = {member["id"] for member in payload["league_members"]}
+            body = orjson.dumps(payload).decode()
+        
+        sends = []
+        for websocket, (user_id, last_body) in list(sockets.items()):
+            if body is None:
+                sends.append(_close_game_socket(league_id, websocket, code))
+            elif user_id not in member_ids:
+                # Membership revoked mid-stream
+                sends.append(_close_game_socket(league_id, websocket, status.WS_1008_POLICY_VIOLATION))
+            elif body != last_body:
+                sends.append(_send_game_status(league_id, websocket, user_id, body))
+        # One slow client doesn't hold up the rest
+        await asyncio.gather(*sends)
+
+@app.websocket("/api/ws/game/{league_id}")
+async def game_status_stream(websocket: WebSocket, league_id: str, token: str = ""):
+    # Browsers can't set headers on a WebSocket handshake, so the JWT rides in the query string
+    try:
+        user = await resolve_user(token)
+        payload = await build_game_status(league_id, user["id"])
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    
+    await websocket.accept()
+    body = orjson.dumps(payload).decode()
+    await websocket.send_text(body)
+    
+    # Join the league's shared feed, starting it for the first socket
+    _game_sockets[league_id][websocket] = (user["id"], body)
+    if league_id not in _game_feeds:
+        _game_changed[league_id] = asyncio.Event()
+        _game_feeds[league_id] = asyncio.create_task(_run_game_feed(league_id))
+    try:
+        # Clients only listen; reading is how we notice the disconnect
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sockets = _game_sockets.get(league_id)
+        if sockets is not None:
+            sockets.pop(websocket, None)
+            if not sockets:
+                # Let the feed notice it has nobody left to serve
+                _notify_game_subscribers(league_id)
+
 @app.post("/api/game/{league_id}/checkin")
 async def handle_checkin(league_id: str, request: CheckInRequest, current_user: dict = Depends(get_current_user)):
     # Check if user is member of this league
@@ -625,102 +1220,144 @@ async def handle_checkin(league_id: str, request: CheckInRequest, current_user:
         "league_id": league_id,
         "user_id": current_user["id"],
         "status": "approved"
-    })
+    }, {"_id": 1})
     if not membership:
         raise HTTPException(status_code=403, detail="Not a member of this league")
     
-    # Get current game
-    current_game = await games_collection.find_one({
-        "league_id": league_id,
-        "status": "active"
-    })
-    if not current_game:
-        raise HTTPException(status_code=404, detail="No active game found")
-    
-    # Get league info for buy-in
-    league = await leagues_collection.find_one({"id": league_id})
-    
-    # Update check-in status
-    checked_in_users = current_game.get("checked_in_users", [])
-    eliminated_users = current_game.get("eliminated_users", [])
-    
-    if request.action == "check_in":
-        if current_user["id"] not in checked_in_users:
-            checked_in_users.append(current_user["id"])
-    
-    elif request.action == "check_out":
-        if current_game.get("game_started", False) and request.finish_position:
-            # Check out with score during active game (elimination)
-            if current_user["id"] in checked_in_users and current_user["id"] not in eliminated_users:
+    active_game_filter = {"league_id": league_id, "status": "active"}
+    game_projection = {"checked_in_users": 1, "eliminated_users": 1, "_id": 0}
+    user_id = current_user["id"]
+    updated_game = None
+    
+    if request.action == "check_out" and request.finish_position:
+        # The lock only serializes this worker; across workers the conditional elimination below and
+        # the unique (game_id, finish_position) index are what keep positions and eliminations single
+        async with _game_locks[league_id]:
+            current_game = await games_collection.find_one(active_game_filter, {
+                "id": 1,
+                "game_started": 1,
+                "checked_in_users": 1,
+                "eliminated_users": 1,
+                "initial_players": 1,
+                "_id": 0
+            })
+            if not current_game:
+                raise HTTPException(status_code=404, detail="No active game found")
+            
+            if current_game.get("game_started", False):
+                checked_in_users = current_game.get("checked_in_users", [])
+                eliminated_users = current_game.get("eliminated_users", [])
                 
-                # Check if this finish position is already taken
-                existing_result = await game_results_collection.find_one({
-                    "game_id": current_game["id"],
-                    "finish_position": request.finish_position
-                })
-                if existing_result:
-                    raise HTTPException(
-                        status_code=400, 
-                        detail=f"Position #{request.finish_position} is already taken by {existing_result['user_name']}"
+                # Check out with score during active game (elimination)
+                if user_id in checked_in_users and user_id not in eliminated_users:
+                    
+                    # Check if this finish position is already taken, and get league info for buy-in
+                    existing_result, league = await asyncio.gather(
+                        game_results_collection.find_one({
+                            "game_id": current_game["id"],
+                            "finish_position": request.finish_position
+                        }, {"user_name": 1, "_id": 0}),
+                        leagues_collection.find_one({"id": league_id}, {"buy_in": 1, "_id": 0})
                     )
+                    if existing_result:
+                        raise HTTPException(
+                            status_code=400, 
+                            detail=f"Position #{request.finish_position} is already taken by {existing_result['user_name']}"
+                        )
+                    
+                    # Get total players count
+                    total_players = len(current_game.get("initial_players", []))
+                    
+                    # Calculate points and earnings
+                    points = calculate_tournament_points(request.finish_position, total_players)
+                    prize_distribution = calculate_prize_distribution(total_players, league["buy_in"])
+                    earnings = prize_distribution.get(request.finish_position, 0) - league["buy_in"]
+                    
+                    # Mark the player out only if they are still at the table, so a player can't be
+                    # eliminated twice; the pre-image plus this player is the new eliminated list
+                    previous_game = await games_collection.find_one_and_update(
+                        {
+                            "id": current_game["id"],
+                            "checked_in_users": user_id,
+                            "eliminated_users": {"$ne": user_id}
+                        },
+                        {"$addToSet": {"eliminated_users": user_id}},
+                        projection=game_projection
+                    )
+                    if previous_game is None:
+                        # Another worker eliminated this player first
+                        raise HTTPException(status_code=400, detail="Player is already eliminated")
+                    
+                    # Save game result immediately
+                    game_result = {
+                        "id": _new_id(),
+                        "game_id": current_game["id"],
+                        "league_id": league_id,
+                        "user_id": user_id,
+                        "user_name": current_user["name"],
+                        "user_avatar": current_user["avatar"],
+                        "finish_position": request.finish_position,
+                        "points_earned": points,
+                        "buy_in_paid": league["buy_in"],
+                        "earnings": earnings,
+                        "created_at": datetime.utcnow()
+                    }
+                    try:
+                        await game_results_collection.insert_one(game_result)
+                    except DuplicateKeyError:
+                        # Another worker took the position after our check; put the player back at the table
+                        taken_by, _ = await asyncio.gather(
+                            game_results_collection.find_one({
+                                "game_id": current_game["id"],
+                                "finish_position": request.finish_position
+                            }, {"user_name": 1, "_id": 0}),
+                            games_collection.update_one(
+                                {"id": current_game["id"]},
+                                {"$pull": {"eliminated_users": user_id}}
+                            )
+                        )
+                        raise HTTPException(
+                            status_code=400,
+                            detail=f"Position #{request.finish_position} is already taken by {taken_by['user_name'] if taken_by else 'another player'}"
+                        )
+                    
+                    eliminated = set(previous_game.get("eliminated_users", []))
+                    eliminated.add(user_id)
+                    await refresh_leaderboard(league_id, [user_id])
+                    _notify_game_subscribers(league_id)
+                    
+                    return {
+                        "success": True,
+                        "message": f"Eliminated in position #{request.finish_position}",
+                        "checked_in_count": len([uid for uid in previous_game.get("checked_in_users", []) if uid not in eliminated]),
+                        "points_earned": points,
+                        "earnings": earnings
+                    }
                 
-                eliminated_users.append(current_user["id"])
-                
-                # Get total players count
-                total_players = len(current_game.get("initial_players", []))
-                
-                # Calculate points and earnings
-                points = calculate_tournament_points(request.finish_position, total_players)
-                prize_distribution = calculate_prize_distribution(total_players, league["buy_in"])
-                earnings = prize_distribution.get(request.finish_position, 0) - league["buy_in"]
-                
-                # Save game result immediately
-                game_result = {
-                    "id": str(uuid.uuid4()),
-                    "game_id": current_game["id"],
-                    "league_id": league_id,
-                    "user_id": current_user["id"],
-                    "user_name": current_user["name"],
-                    "user_avatar": current_user["avatar"],
-                    "finish_position": request.finish_position,
-                    "points_earned": points,
-                    "buy_in_paid": league["buy_in"],
-                    "earnings": earnings,
-                    "created_at": datetime.utcnow()
-                }
-                await game_results_collection.insert_one(game_result)
-                
-                # Update game in database
-                await games_collection.update_one(
-                    {"id": current_game["id"]},
-                    {"$set": {
-                        "checked_in_users": checked_in_users,
-                        "eliminated_users": eliminated_users
-                    }}
-                )
-                
-                return {
-                    "success": True,
-                    "message": f"Eliminated in position #{request.finish_position}",
-                    "checked_in_count": len([uid for uid in checked_in_users if uid not in eliminated_users]),
-                    "points_earned": points,
-                    "earnings": earnings
-                }
+                # Not at the table (never checked in or already out): nothing to update
+                updated_game = current_game
+    
+    if updated_game is None:
+        # Single atomic update: no read-modify-write race between concurrent check-ins
+        if request.action == "check_in":
+            update = {"$addToSet": {"checked_in_users": user_id}}
         else:
             # Regular check out (before game starts)
-            if current_user["id"] in checked_in_users:
-                checked_in_users.remove(current_user["id"])
-    
-    # Update game in database
-    await games_collection.update_one(
-        {"id": current_game["id"]},
-        {"$set": {
-            "checked_in_users": checked_in_users,
-            "eliminated_users": eliminated_users
-        }}
-    )
+            update = {"$pull": {"checked_in_users": user_id}}
+        
+        updated_game = await games_collection.find_one_and_update(
+            active_game_filter,
+            update,
+            projection=game_projection,
+            return_document=ReturnDocument.AFTER
+        )
+        _notify_game_subscribers(league_id)
+    
+    if not updated_game:
+        raise HTTPException(status_code=404, detail="No active game found")
     
-    active_players = len([uid for uid in checked_in_users if uid not in eliminated_users])
+    eliminated = set(updated_game.get("eliminated_users", []))
+    active_players = len([uid for uid in updated_game.get("checked_in_users", []) if uid not in eliminated])
     
     return {
         "success": True,
@@ -731,33 +1368,35 @@ async def handle_checkin(league_id: str, request: CheckInRequest, current_user:
 @app.post("/api/game/{league_id}/start")
 async def start_game(league_id: str, current_user: dict = Depends(get_current_user)):
     # Check if user is admin of this league
-    league = await leagues_collection.find_one({"id": league_id})
+    league = await leagues_collection.find_one({"id": league_id}, {"admin_id": 1, "_id": 0})
     if not league or league["admin_id"] != current_user["id"]:
         raise HTTPException(status_code=403, detail="Only league admin can start games")
     
-    # Get current game
-    current_game = await games_collection.find_one({
-        "league_id": league_id,
-        "status": "active"
-    })
-    if not current_game:
-        raise HTTPException(status_code=404, detail="No active game found")
-    
-    if len(current_game.get("checked_in_users", [])) < 2:
-        raise HTTPException(status_code=400, detail="Need at least 2 players to start")
-    
-    # Save initial players list for calculating points later
-    initial_players = current_game.get("checked_in_users", []).copy()
-    
-    # Start game
-    await games_collection.update_one(
-        {"id": current_game["id"]},
-        {"$set": {
-            "game_started": True,
-            "initial_players": initial_players,
-            "started_at": datetime.utcnow()
-        }}
-    )
+    async with _game_locks[league_id]:
+        # Get current game
+        current_game = await games_collection.find_one({
+            "league_id": league_id,
+            "status": "active"
+        }, {"id": 1, "checked_in_users": 1, "_id": 0})
+        if not current_game:
+            raise HTTPException(status_code=404, detail="No active game found")
+        
+        if len(current_game.get("checked_in_users", [])) < 2:
+            raise HTTPException(status_code=400, detail="Need at least 2 players to start")
+        
+        # Save initial players list for calculating points later
+        initial_players = current_game.get("checked_in_users", []).copy()
+        
+        # Start game
+        await games_collection.update_one(
+            {"id": current_game["id"]},
+            {"$set": {
+                "game_started": True,
+                "initial_players": initial_players,
+                "started_at": datetime.utcnow()
+            }}
+        )
+    _notify_game_subscribers(league_id)
     
     return {
         "success": True,
@@ -769,55 +1408,66 @@ async def start_game(league_id: str, current_user: dict = Depends(get_current_us
 @app.post("/api/game/{league_id}/complete")
 async def complete_game(league_id: str, submission: GameResultSubmission, current_user: dict = Depends(get_current_user)):
     # Check if user is admin of this league
-    league = await leagues_collection.find_one({"id": league_id})
+    league = await leagues_collection.find_one({"id": league_id}, {"admin_id": 1, "buy_in": 1, "_id": 0})
     if not league or league["admin_id"] != current_user["id"]:
         raise HTTPException(status_code=403, detail="Only league admin can complete games")
     
-    # Get current game
-    current_game = await games_collection.find_one({
-        "league_id": league_id,
-        "status": "active"
-    })
-    if not current_game:
-        raise HTTPException(status_code=404, detail="No active game found")
-    
-    if not current_game.get("game_started", False):
-        raise HTTPException(status_code=400, detail="Game must be started before completing")
-    
-    # Calculate prize distribution
-    total_players = len(submission.results)
-    prize_distribution = calculate_prize_distribution(total_players, league["buy_in"])
-    
-    # Save game results (this might override live results, but gives admin final control)
-    # First, delete any existing results for this game
-    await game_results_collection.delete_many({"game_id": current_game["id"]})
-    
-    # Save new results
-    for result in submission.results:
-        # Calculate points and earnings
-        points = calculate_tournament_points(result.finish_position, total_players)
-        earnings = prize_distribution.get(result.finish_position, 0) - league["buy_in"]
-        
-        game_result = {
-            "id": str(uuid.uuid4()),
-            "game_id": current_game["id"],
+    async with _game_locks[league_id]:
+        # Get current game
+        current_game = await games_collection.find_one({
             "league_id": league_id,
-            "user_id": result.user_id,
-            "user_name": result.user_name,
-            "user_avatar": result.user_avatar if hasattr(result, 'user_avatar') else "🎯",
-            "finish_position": result.finish_position,
-            "points_earned": points,
-            "buy_in_paid": league["buy_in"],
-            "earnings": earnings,
-            "created_at": datetime.utcnow()
-        }
-        await game_results_collection.insert_one(game_result)
+            "status": "active"
+        }, {"id": 1, "game_started": 1, "_id": 0})
+        if not current_game:
+            raise HTTPException(status_code=404, detail="No active game found")
+        
+        if not current_game.get("game_started", False):
+            raise HTTPException(status_code=400, detail="Game must be started before completing")
+        
+        # Positions are unique per game in game_results, so reject repeats before replacing anything
+        positions = [result.finish_position for result in submission.results]
+        if len(set(positions)) != len(positions):
+            raise HTTPException(status_code=400, detail="Each finish position can only be used once")
+        
+        # Calculate prize distribution
+        total_players = len(submission.results)
+        prize_distribution = calculate_prize_distribution(total_players, league["buy_in"])
+        
+        # Save game results (this might override live results, but gives admin final control)
+        # First, delete any existing results for this game
+        replaced_user_ids = await game_results_collection.distinct("user_id", {"game_id": current_game["id"]})
+        await game_results_collection.delete_many({"game_id": current_game["id"]})
+        
+        # Save new results in one round trip
+        created_at = datetime.utcnow()
+        game_results = [
+            {
+                "id": _new_id(),
+                "game_id": current_game["id"],
+                "league_id": league_id,
+                "user_id": result.user_id,
+                "user_name": result.user_name,
+                "user_avatar": result.user_avatar if hasattr(result, 'user_avatar') else "🎯",
+                "finish_position": result.finish_position,
+                "points_earned": calculate_tournament_points(result.finish_position, total_players),
+                "buy_in_paid": league["buy_in"],
+                "earnings": prize_distribution.get(result.finish_position, 0) - league["buy_in"],
+                "created_at": created_at
+            }
+            for result in submission.results
+        ]
+        if game_results:
+            await game_results_collection.insert_many(game_results, ordered=False)
+        
+        # Mark game as completed
+        await games_collection.update_one(
+            {"id": current_game["id"]},
+            {"$set": {"game_completed": True, "completed_at": datetime.utcnow()}}
+        )
     
-    # Mark game as completed
-    await games_collection.update_one(
-        {"id": current_game["id"]},
-        {"$set": {"game_completed": True, "completed_at": datetime.utcnow()}}
-    )
+    # Re-rank everyone whose results were replaced or submitted
+    await refresh_leaderboard(league_id, replaced_user_ids + [result.user_id for result in submission.results])
+    _notify_game_subscribers(league_id)
     
     return {
         "success": True,
@@ -829,86 +1479,116 @@ async def complete_game(league_id: str, submission: GameResultSubmission, curren
 @app.post("/api/game/{league_id}/reset")
 async def reset_game(league_id: str, current_user: dict = Depends(get_current_user)):
     # Check if user is admin of this league
-    league = await leagues_collection.find_one({"id": league_id})
+    league = await leagues_collection.find_one({"id": league_id}, {"admin_id": 1, "_id": 0})
     if not league or league["admin_id"] != current_user["id"]:
         raise HTTPException(status_code=403, detail="Only league admin can reset games")
     
-    # Create new game (end current one and start fresh)
-    await games_collection.update_many(
-        {"league_id": league_id, "status": "active"},
-        {"$set": {"status": "completed"}}
-    )
-    
-    # Create new active game
-    game_id = str(uuid.uuid4())
-    new_game = {
-        "id": game_id,
-        "league_id": league_id,
-        "status": "active",
-        "checked_in_users": [],
-        "eliminated_users": [],
-        "initial_players": [],
-        "seat_assignments": [],
-        "game_started": False,
-        "created_at": datetime.utcnow()
-    }
-    await games_collection.insert_one(new_game)
+    async with _game_locks[league_id]:
+        # Create new game (end current one and start fresh)
+        await games_collection.update_many(
+            {"league_id": league_id, "status": "active"},
+            {"$set": {"status": "completed"}}
+        )
+        
+        # Create new active game
+        new_game = await get_or_create_active_game(league_id, {"id": 1, "_id": 0})
+    _notify_game_subscribers(league_id)
     
     return {
         "success": True,
         "message": "Game reset successfully",
-        "game_id": game_id
+        "game_id": new_game["id"]
     }
 
 # Leaderboard endpoints
 @app.get("/api/leaderboard")
-async def get_overall_leaderboard(current_user: dict = Depends(get_current_user)):
-    """Get overall leaderboard across all leagues"""
-    leaderboard = await calculate_leaderboard()
+async def get_overall_leaderboard(
+    limit: Optional[int] = Query(None, ge=1),
+    current_user: dict = Depends(get_current_user)
+):
+    """Get overall leaderboard across all leagues (the top limit entries when given)"""
+    leaderboard = await calculate_leaderboard(limit=limit)
     return leaderboard
 
 @app.get("/api/leaderboard/league/{league_id}")
-async def get_league_leaderboard(league_id: str, current_user: dict = Depends(get_current_user)):
-    """Get leaderboard for a specific league"""
+async def get_league_leaderboard(
+    league_id: str,
+    limit: Optional[int] = Query(None, ge=1),
+    current_user: dict = Depends(get_current_user)
+):
+    """Get leaderboard for a specific league (the top limit entries when given)"""
     # Check if user is member of this league
     membership = await memberships_collection.find_one({
         "league_id": league_id,
         "user_id": current_user["id"],
         "status": "approved"
-    })
+    }, {"_id": 1})
     if not membership:
         raise HTTPException(status_code=403, detail="Not a member of this league")
     
-    leaderboard = await calculate_leaderboard(league_id)
+    leaderboard = await calculate_leaderboard(league_id, limit)
     return leaderboard
 
 @app.get("/api/stats/user/{user_id}")
 async def get_user_stats(user_id: str, current_user: dict = Depends(get_current_user)):
     """Get detailed stats for a specific user"""
-    # Get user info
-    user = await users_collection.find_one({"id": user_id})
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    # Calculate user statistics
+    # Summary statistics and the 10 most recent games (with league names) in one aggregation
     pipeline = [
         {"$match": {"user_id": user_id}},
         {
-            "$group": {
-                "_id": None,
-                "total_points": {"$sum": "$points_earned"},
-                "total_games": {"$sum": 1},
-                "total_wins": {
-                    "$sum": {"$cond": [{"$eq": ["$finish_position", 1]}, 1, 0]}
-                },
-                "total_earnings": {"$sum": "$earnings"},
-                "avg_finish": {"$avg": "$finish_position"},
-                "best_finish": {"$min": "$finish_position"}
+            "$facet": {
+                "stats": [
+                    {
+                        "$group": {
+                            "_id": None,
+                            "total_points": {"$sum": "$points_earned"},
+                            "total_games": {"$sum": 1},
+                            "total_wins": {
+                                "$sum": {"$cond": [{"$eq": ["$finish_position", 1]}, 1, 0]}
+                            },
+                            "total_earnings": {"$sum": "$earnings"},
+                            "avg_finish": {"$avg": "$finish_position"},
+                            "best_finish": {"$min": "$finish_position"}
+                        }
+                    }
+                ],
+                "recent_games": [
+                    {"$sort": {"created_at": -1}},
+                    {"$limit": 10},
+                    {
+                        "$lookup": {
+                            "from": "leagues",
+                            "localField": "league_id",
+                            "foreignField": "id",
+                            "as": "league"
+                        }
+                    },
+                    {
+                        "$project": {
+                            "game_id": 1,
+                            "league_name": {"$ifNull": [{"$arrayElemAt": ["$league.name", 0]}, "Unknown League"]},
+                            "finish_position": 1,
+                            "points_earned": 1,
+                            "earnings": 1,
+                            "created_at": 1,
+                            "_id": 0
+                        }
+                    }
+                ]
             }
         }
     ]
     
-    stats_result = await game_results_collection.aggregate(pipeline).to_list(1)
+    # User info and the statistics don't depend on each other, so fetch them together
+    user, facets = await asyncio.gather(
+        users_collection.find_one({"id": user_id}, {"id": 1, "name": 1, "avatar": 1, "_id": 0}),
+        game_results_collection.aggregate(pipeline).to_list(1)
+    )
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    stats_result = facets[0]["stats"]
+    recent_games = facets[0]["recent_games"]
     
     if not stats_result:
         stats = {
@@ -926,20 +1606,6 @@ async def get_user_stats(user_id: str, current_user: dict = Depends(get_current_
         stats["avg_finish"] = round(stats["avg_finish"], 1) if stats["avg_finish"] else 0
         stats["win_rate"] = round(stats["win_rate"], 1)
     
-    # Get recent games
-    recent_games = []
-    async for result in game_results_collection.find({"user_id": user_id}).sort("created_at", -1).limit(10):
-        # Get league info
-        league = await leagues_collection.find_one({"id": result["league_id"]})
-        recent_games.append({
-            "game_id": result["game_id"],
-            "league_name": league["name"] if league else "Unknown League",
-            "finish_position": result["finish_position"],
-            "points_earned": result["points_earned"],
-            "earnings": result["earnings"],
-            "created_at": result["created_at"]
-        })
-    
     return {
         "user": {
             "id": user["id"],
@@ -952,4 +1618,14 @@ async def get_user_stats(user_id: str, current_user: dict = Depends(get_current_
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+    # Multiple workers need the app as an import string; each worker is its own process with
+    # its own Mongo pool, auth cache and game locks (shared game state lives in Mongo)
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=8001,
+        workers=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="uvloop",
+        http="httptools",
+        log_level="warning"
+    )
\ No newline at end of file
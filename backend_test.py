@@ -1,59 +1,202 @@
-import requests
+import functools
+import httpx
+import numpy as np
+import orjson
 import unittest
 import sys
 import os
 import uuid
 import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# Expected tournament points by finish position (index 0 unused); positions past 5 earn 20
+_EXPECTED_POINTS = (0, 100, 80, 60, 40, 40)
+# The same table with a trailing 20, so clipping a position to the last index covers everything past 5
+_EXPECTED_POINTS_TABLE = np.array(_EXPECTED_POINTS + (20,), dtype=np.int32)
+
+
+class APITestFailure(Exception):
+    """Raised by run_test in strict mode when a call doesn't return the expected status"""
+
+
+def fail_fast(flow):
+    """Turn an APITestFailure raised anywhere in a flow into that flow returning False"""
+    @functools.wraps(flow)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return flow(self, *args, **kwargs)
+        except APITestFailure as e:
+            self.log(f"❌ Stopping {flow.__name__}: {e}")
+            return False
+    return wrapper
+
+
 class PokerLeagueAPITester:
-    def __init__(self, base_url):
+    def __init__(self, base_url, verbose=False, strict=False):
         self.base_url = base_url
+        # strict makes the first failed call abort the running flow instead of carrying on
+        self.strict = strict
         self.tests_run = 0
         self.tests_passed = 0
         self.token = None
         self.user = None
         self.test_users = []
         self.test_league = None
+        # email -> (access token, user) for every user registered or logged in here,
+        # so acting as another user needs no fresh login
+        self.known_users = {}
+        
+        # One pooled client for every call. Over HTTPS it negotiates HTTP/2, so the concurrent
+        # check-ins multiplex over a single connection instead of opening one each.
+        # trust_env=False skips per-request .netrc/proxy environment lookups.
+        self.client = httpx.Client(
+            base_url=base_url,
+            timeout=10.0,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=2,  # Connection failures only; requests are never replayed
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            ),
+            headers={'Content-Type': 'application/json', 'Accept': 'application/json'},
+            trust_env=False
+        )
+        # One worker pool for every concurrent section (registration, check-ins, eliminations,
+        # verification), so threads are started once per tester rather than once per section
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='pltest')
+        # Check-ins fan out across threads, so the pass/fail counters need a lock
+        self._counter_lock = threading.Lock()
+        # Short-lived cache for idempotent GETs: (endpoint, token) -> (fetched_at, response body)
+        self._get_cache = {}
+        self.cache_ttl = 2.0
+        self.cache_hits = 0
+        # Last ETag seen per (endpoint, token) and its body, revalidated with If-None-Match once the TTL lapses
+        self._etags = {}
+        self.not_modified = 0
+        # Progress lines are buffered and printed by flush_log, unless verbose prints them as they happen
+        self.verbose = verbose
+        self._log = []
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, auth=False):
-        """Run a single API test"""
-        url = f"{self.base_url}/{endpoint}"
-        headers = {'Content-Type': 'application/json'}
-        
-        if auth and self.token:
-            headers['Authorization'] = f'Bearer {self.token}'
-        
-        self.tests_run += 1
-        print(f"\n🔍 Testing {name}...")
+    def log(self, message=""):
+        """Record a progress line; printing it is deferred unless running verbose"""
+        if self.verbose:
+            print(message)
+        else:
+            self._log.append(message)
+
+    def flush_log(self):
+        """Print and clear the buffered progress lines"""
+        if self._log:
+            print("\n".join(self._log))
+            self._log.clear()
+
+    def invalidate_cache(self, *prefixes):
+        """Drop cached GETs (for every user) whose endpoint starts with any of the given prefixes"""
+        for key in list(self._get_cache):
+            if key[0].startswith(prefixes):
+                self._get_cache.pop(key, None)
+
+    def close(self):
+        """Stop the worker threads and release the pooled connections"""
+        self._pool.shutdown(wait=True)
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def warm_up(self):
+        """Open a pooled connection up front so the first measured test doesn't pay the handshake"""
+        try:
+            self.client.head("/", timeout=5)
+        except httpx.HTTPError as e:
+            self.log(f"⚠️  Warm-up request failed: {e}")
+
+    def run_test(self, name, method, endpoint, expected_status, data=None, auth=False, token=None, cacheable=False):
+        """
+        Run a single API test (token overrides self.token, for calls made on other users' behalf).
+        cacheable GETs expecting 200 are answered from the cache for cache_ttl seconds, per user.
+        A POST evicts cached GETs under its parent resource (checkin -> api/game/{id}/...).
+        Past the TTL they are revalidated with If-None-Match, and a 304 reuses the stored body.
+        In strict mode a failure raises APITestFailure instead of returning (False, {}).
+        """
+        # Common headers live on the client; only the acting user's token varies per request
+        token = token or self.token
+        headers = {'Authorization': f'Bearer {token}'} if auth and token else None
+        
+        with self._counter_lock:
+            self.tests_run += 1
+        self.log(f"\n🔍 Testing {name}...")
+        
+        cache_key = (endpoint, token if auth else None)
+        use_cache = cacheable and method == 'GET' and expected_status == 200
+        if use_cache:
+            cached = self._get_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self.cache_ttl:
+                with self._counter_lock:
+                    self.tests_passed += 1
+                    self.cache_hits += 1
+                self.log("✅ Passed - Status: 200 (cached)")
+                return True, cached[1]
+        
+        if method == 'POST':
+            self.invalidate_cache(endpoint.rsplit('/', 1)[0])
+        
+        # The server checks the ETag itself, so POST invalidation above doesn't need to drop these
+        validator = self._etags.get(cache_key) if use_cache else None
+        if validator:
+            headers = {**(headers or {}), 'If-None-Match': validator[0]}
         
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=headers)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers)
+            # Content-Type is already on the client, so send orjson's bytes directly
+            body = orjson.dumps(data) if data is not None else None
+            response = self.client.request(method, f"/{endpoint}", content=body, headers=headers)
+
+            if validator and response.status_code == 304:
+                with self._counter_lock:
+                    self.tests_passed += 1
+                    self.not_modified += 1
+                self.log("✅ Passed - Status: 304 (not modified)")
+                self._get_cache[cache_key] = (time.monotonic(), validator[1])
+                return True, validator[1]
 
             success = response.status_code == expected_status
             if success:
-                self.tests_passed += 1
-                print(f"✅ Passed - Status: {response.status_code}")
+                with self._counter_lock:
+                    self.tests_passed += 1
+                self.log(f"✅ Passed - Status: {response.status_code}")
                 try:
-                    return success, response.json()
-                except:
+                    body = orjson.loads(response.content)
+                except orjson.JSONDecodeError:
                     return success, {}
+                if use_cache:
+                    self._get_cache[cache_key] = (time.monotonic(), body)
+                    if 'ETag' in response.headers:
+                        self._etags[cache_key] = (response.headers['ETag'], body)
+                return success, body
             else:
-                print(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
+                self.log(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
                 try:
-                    error_data = response.json()
-                    print(f"Error details: {error_data}")
-                except:
-                    print(f"Response text: {response.text}")
-                return success, {}
+                    error_data = orjson.loads(response.content)
+                    self.log(f"Error details: {error_data}")
+                except orjson.JSONDecodeError:
+                    self.log(f"Response text: {response.text}")
 
         except Exception as e:
-            print(f"❌ Failed - Error: {str(e)}")
+            self.log(f"❌ Failed - Error: {str(e)}")
+            if self.strict:
+                raise APITestFailure(f"{name}: {e}") from e
             return False, {}
 
+        # Only an unexpected status gets here
+        if self.strict:
+            raise APITestFailure(f"{name}: expected {expected_status}, got {response.status_code}")
+        return False, {}
+
     # Authentication Tests
     def test_register_user(self, email=None, password="Test123!", name=None):
         """Test user registration"""
@@ -77,9 +220,10 @@ class PokerLeagueAPITester:
         )
         
         if success:
-            print(f"Registered user: {response.get('user', {}).get('name')}")
+            self.log(f"Registered user: {response.get('user', {}).get('name')}")
             self.token = response.get('access_token')
             self.user = response.get('user')
+            self.remember_user(self.token, self.user)
             return success, self.user
         return success, None
 
@@ -99,12 +243,26 @@ class PokerLeagueAPITester:
         )
         
         if success:
-            print(f"Logged in user: {response.get('user', {}).get('name')}")
+            self.log(f"Logged in user: {response.get('user', {}).get('name')}")
             self.token = response.get('access_token')
             self.user = response.get('user')
+            self.remember_user(self.token, self.user)
             return success, self.user
         return success, None
 
+    def remember_user(self, token, user):
+        """Record a user's token so later calls can act as them without logging in"""
+        self.known_users[user.get('email')] = (token, user)
+
+    def token_for(self, user):
+        """The stored token for this user, or None if this tester never registered or logged them in"""
+        token, _ = self.known_users.get(user.get('email'), (None, None))
+        return token
+
+    def switch_user(self, email):
+        """Act as a previously registered or logged-in user; no HTTP call"""
+        self.token, self.user = self.known_users[email]
+
     def test_get_current_user(self):
         """Test getting current user info"""
         success, response = self.run_test(
@@ -112,11 +270,12 @@ class PokerLeagueAPITester:
             "GET",
             "api/auth/me",
             200,
-            auth=True
+            auth=True,
+            cacheable=True
         )
         
         if success:
-            print(f"Current user: {response.get('name')}")
+            self.log(f"Current user: {response.get('name')}")
         return success, response
 
     # League Tests
@@ -143,7 +302,7 @@ class PokerLeagueAPITester:
         )
         
         if success:
-            print(f"Created league: {name} with ID: {response.get('league_id')}")
+            self.log(f"Created league: {name} with ID: {response.get('league_id')}")
             return success, response.get('league_id')
         return success, None
 
@@ -154,11 +313,12 @@ class PokerLeagueAPITester:
             "GET",
             "api/leagues",
             200,
-            auth=True
+            auth=True,
+            cacheable=True
         )
         
         if success:
-            print(f"Retrieved {len(response)} leagues")
+            self.log(f"Retrieved {len(response)} leagues")
         return success, response
 
     def test_get_my_leagues(self):
@@ -172,7 +332,7 @@ class PokerLeagueAPITester:
         )
         
         if success:
-            print(f"Retrieved {len(response)} of my leagues")
+            self.log(f"Retrieved {len(response)} of my leagues")
         return success, response
 
     def test_join_league(self, league_id):
@@ -190,10 +350,50 @@ class PokerLeagueAPITester:
             auth=True
         )
         
+        self.invalidate_cache(f"api/game/{league_id}/status")
         if success:
-            print(f"Joined league: {response.get('message')}")
+            self.log(f"Joined league: {response.get('message')}")
         return success, response
 
+    def register_players(self, league_id, count):
+        """Register count new users and join each to the league, concurrently; returns the joined users"""
+        def register_and_join(_):
+            suffix = uuid.uuid4().hex
+            success, response = self.run_test(
+                "Register User",
+                "POST",
+                "api/auth/register",
+                200,
+                data={
+                    "email": f"test{suffix[:8]}@example.com",
+                    "password": "Test123!",
+                    "name": f"Test User {suffix[8:13]}"
+                }
+            )
+            if not success:
+                return None
+            user = response.get('user')
+            self.remember_user(response.get('access_token'), user)
+            self.log(f"Registered user: {user.get('name')}")
+            
+            # Join the league with this user
+            join_success, _ = self.run_test(
+                "Join League",
+                "POST",
+                "api/leagues/join",
+                200,
+                data={"league_id": league_id},
+                auth=True,
+                token=response.get('access_token')
+            )
+            self.invalidate_cache(f"api/game/{league_id}/status")
+            if not join_success:
+                self.log(f"❌ Failed to join league for user {user.get('name')}")
+            return user
+        
+        users = list(self._pool.map(register_and_join, range(count)))
+        return [user for user in users if user]
+
     # Game Tests
     def test_get_game_status(self, league_id):
         """Test getting game status for a league"""
@@ -202,15 +402,16 @@ class PokerLeagueAPITester:
             "GET",
             f"api/game/{league_id}/status",
             200,
-            auth=True
+            auth=True,
+            cacheable=True
         )
         
         if success:
-            print(f"Game status: {response.get('checked_in_players', 0)} players checked in")
-            print(f"Tables needed: {response.get('tables_needed', 0)}")
+            self.log(f"Game status: {response.get('checked_in_players', 0)} players checked in")
+            self.log(f"Tables needed: {response.get('tables_needed', 0)}")
         return success, response
 
-    def test_player_checkin(self, league_id, action="check_in", finish_position=None):
+    def test_player_checkin(self, league_id, action="check_in", finish_position=None, token=None):
         """Test checking in a player or checking out with score"""
         data = {
             "league_id": league_id,
@@ -226,17 +427,73 @@ class PokerLeagueAPITester:
             f"api/game/{league_id}/checkin",
             200,
             data=data,
-            auth=True
+            auth=True,
+            token=token
         )
         
+        if finish_position is not None:
+            # Eliminations record results, which feed the leaderboards and stats
+            self.invalidate_cache("api/leaderboard", "api/stats")
         if success:
-            print(f"Player {action}: {response.get('message', '')}")
-            print(f"Total checked in: {response.get('checked_in_count', 0)}")
+            self.log(f"Player {action}: {response.get('message', '')}")
+            self.log(f"Total checked in: {response.get('checked_in_count', 0)}")
             if finish_position and response.get('points_earned'):
-                print(f"Points earned: {response.get('points_earned')}")
-                print(f"Earnings: ${response.get('earnings')}")
+                self.log(f"Points earned: {response.get('points_earned')}")
+                self.log(f"Earnings: ${response.get('earnings')}")
         return success, response
 
+    def check_in_players(self, league_id, players):
+        """Check each player in with their own token, concurrently; returns (user, checked_in) pairs"""
+        def check_in_as(user):
+            token = self.token_for(user)
+            if not token:
+                # Only users this tester never registered or logged in need a login first
+                login_success, response = self.run_test(
+                    "Login User",
+                    "POST",
+                    "api/auth/login",
+                    200,
+                    data={"email": user.get('email'), "password": "Test123!"}
+                )
+                if not login_success:
+                    return user, False
+                token = response.get('access_token')
+                self.remember_user(token, response.get('user'))
+            checkin_success, _ = self.test_player_checkin(league_id, token=token)
+            return user, checkin_success
+        
+        # Check-ins are independent of each other, so only the slowest one is on the critical path
+        results = list(self._pool.map(check_in_as, players))
+        
+        for user, checked_in in results:
+            if checked_in:
+                self.log(f"✅ Checked in user {user.get('name')}")
+            else:
+                self.log(f"❌ Failed to check in user {user.get('name')}")
+        return results
+
+    def test_batch_eliminations(self, league_id, eliminations):
+        """Check out each (user, finish_position) concurrently with the user's own token; returns (user, eliminated) pairs"""
+        def eliminate(elimination):
+            user, finish_position = elimination
+            success, response = self.test_player_checkin(
+                league_id, action="check_out", finish_position=finish_position,
+                token=self.token_for(user)
+            )
+            return user, finish_position, success, response
+        
+        # Positions are distinct and the server checks them under the game lock, so order doesn't matter
+        results = list(self._pool.map(eliminate, eliminations))
+        
+        for user, finish_position, success, response in results:
+            if success:
+                self.log(f"✅ {user.get('name')} eliminated in position #{finish_position}")
+                self.log(f"   Points earned: {response.get('points_earned', 0)}")
+                self.log(f"   Earnings: ${response.get('earnings', 0)}")
+            else:
+                self.log(f"❌ Failed to eliminate {user.get('name')}")
+        return [(user, success) for user, _, success, _ in results]
+
     def test_start_game(self, league_id):
         """Test starting a game"""
         success, response = self.run_test(
@@ -248,7 +505,7 @@ class PokerLeagueAPITester:
         )
         
         if success:
-            print(f"Game started: {response.get('message', '')}")
+            self.log(f"Game started: {response.get('message', '')}")
         return success, response
 
     def test_complete_game(self, league_id, results):
@@ -266,10 +523,11 @@ class PokerLeagueAPITester:
             auth=True
         )
         
+        self.invalidate_cache("api/leaderboard", "api/stats")
         if success:
-            print(f"Game completed: {response.get('message', '')}")
-            print(f"Total players: {response.get('total_players', 0)}")
-            print(f"Prize pool: ${response.get('prize_pool', 0)}")
+            self.log(f"Game completed: {response.get('message', '')}")
+            self.log(f"Total players: {response.get('total_players', 0)}")
+            self.log(f"Prize pool: ${response.get('prize_pool', 0)}")
         return success, response
 
     def test_reset_game(self, league_id):
@@ -283,25 +541,29 @@ class PokerLeagueAPITester:
         )
         
         if success:
-            print(f"Game reset: {response.get('message', '')}")
+            self.log(f"Game reset: {response.get('message', '')}")
         return success, response
 
     # Leaderboard Tests
-    def test_get_overall_leaderboard(self):
-        """Test getting the overall leaderboard"""
+    def test_get_overall_leaderboard(self, limit=10):
+        """Test getting the overall leaderboard; only the top limit entries are fetched, since it grows with every run"""
         success, response = self.run_test(
             "Get Overall Leaderboard",
             "GET",
-            "api/leaderboard",
+            f"api/leaderboard?limit={limit}",
             200,
-            auth=True
+            auth=True,
+            cacheable=True
         )
         
         if success:
-            print(f"Retrieved leaderboard with {len(response)} entries")
+            self.log(f"Retrieved leaderboard with {len(response)} entries")
+            if len(response) > limit:
+                self.log(f"❌ Expected at most {limit} entries with limit={limit}")
+                return False, response
             if len(response) > 0:
                 top_player = response[0]
-                print(f"Top player: {top_player.get('user_name')} with {top_player.get('total_points')} points")
+                self.log(f"Top player: {top_player.get('user_name')} with {top_player.get('total_points')} points")
         return success, response
 
     def test_get_league_leaderboard(self, league_id):
@@ -311,11 +573,12 @@ class PokerLeagueAPITester:
             "GET",
             f"api/leaderboard/league/{league_id}",
             200,
-            auth=True
+            auth=True,
+            cacheable=True
         )
         
         if success:
-            print(f"Retrieved league leaderboard with {len(response)} entries")
+            self.log(f"Retrieved league leaderboard with {len(response)} entries")
         return success, response
 
     def test_get_user_stats(self, user_id):
@@ -325,460 +588,311 @@ class PokerLeagueAPITester:
             "GET",
             f"api/stats/user/{user_id}",
             200,
-            auth=True
+            auth=True,
+            cacheable=True
         )
         
         if success:
             stats = response.get('stats', {})
-            print(f"User stats: {stats.get('total_games', 0)} games played")
-            print(f"Total points: {stats.get('total_points', 0)}")
-            print(f"Win rate: {stats.get('win_rate', 0)}%")
-            print(f"Total earnings: ${stats.get('total_earnings', 0)}")
+            self.log(f"User stats: {stats.get('total_games', 0)} games played")
+            self.log(f"Total points: {stats.get('total_points', 0)}")
+            self.log(f"Win rate: {stats.get('win_rate', 0)}%")
+            self.log(f"Total earnings: ${stats.get('total_earnings', 0)}")
         return success, response
 
-    # Complete Flow Test
-    def test_real_time_score_logging_flow(self):
-        """Test the NEW Real-Time Score Logging feature"""
-        print("\n=== TESTING REAL-TIME SCORE LOGGING FLOW ===")
-        
+    def _setup_league_with_players(self, n, buy_in=100):
+        """
+        Register an admin and n players, create a league they all join, check everyone in and
+        start the game; returns (admin, players, league_id), or None after logging the failure.
+        """
         # 1. Register admin user
         admin_success, admin = self.test_register_user()
         if not admin_success:
-            print("❌ Failed to register admin user")
-            return False
-        
-        admin_id = admin.get('id')
-        admin_email = admin.get('email')
+            self.log("❌ Failed to register admin user")
+            return None
         
         # 2. Create a league
-        league_success, league_id = self.test_create_league(buy_in=100)
+        league_success, league_id = self.test_create_league(buy_in=buy_in)
         if not league_success or not league_id:
-            print("❌ Failed to create league")
-            return False
+            self.log("❌ Failed to create league")
+            return None
         
-        self.test_league = league_id
+        # 3. Register n more test users, who join the league
+        test_users = self.register_players(league_id, n)
+        if len(test_users) < n:
+            self.log("❌ Failed to create enough test users")
+            return None
         
-        # 3. Register 4 more test users (5 total players)
-        test_users = []
-        for i in range(4):
-            # Save admin token
-            admin_token = self.token
-            
-            # Register new user
-            user_success, user = self.test_register_user()
-            if user_success and user:
-                test_users.append(user)
-                
-                # Join the league with this user
-                join_success, _ = self.test_join_league(league_id)
-                if not join_success:
-                    print(f"❌ Failed to join league for user {user.get('name')}")
-            
-            # Restore admin token
-            self.token = admin_token
-            self.user = admin
+        self.log(f"✅ Created {len(test_users)} test users who joined the league")
         
+        self.test_league = league_id
         self.test_users = test_users
         
-        if len(test_users) < 4:
-            print("❌ Failed to create enough test users")
-            return False
-        
-        print(f"✅ Created {len(test_users)} test users who joined the league")
-        
-        # 4. Get initial game status
+        # 4. First get game status to initialize the game
         _, game_status = self.test_get_game_status(league_id)
         if not game_status:
-            print("❌ Failed to get initial game status")
-            return False
+            self.log("❌ Failed to get initial game status")
+            return None
             
-        print("✅ Game initialized successfully")
+        self.log("✅ Game initialized successfully")
         
         # 5. Check-in all users (admin + test users)
         all_players = [admin] + test_users
-        for user in all_players:
-            # Login as this user
-            login_success, _ = self.test_login_user(user.get('email'))
-            if login_success:
-                # Check in
-                checkin_success, _ = self.test_player_checkin(league_id)
-                if not checkin_success:
-                    print(f"❌ Failed to check in user {user.get('name')}")
-                else:
-                    print(f"✅ Checked in user {user.get('name')}")
-        
-        # 6. Login as admin and start the game
-        login_success, _ = self.test_login_user(admin_email)
-        if not login_success:
-            print("❌ Failed to log back in as admin")
-            return False
+        checkins = self.check_in_players(league_id, all_players)
+        if not all(checked_in for _, checked_in in checkins):
+            # Everything after this needs the full table, so stop rather than spend requests on a doomed flow
+            self.log("❌ Not every player checked in, stopping this flow")
+            return None
         
+        # 6. Start the game as admin (check-ins used each player's own token, so self.token is still the admin's)
         # Get game status to verify check-ins
         _, game_status = self.test_get_game_status(league_id)
         checked_in = game_status.get('checked_in_players', 0)
-        print(f"✅ {checked_in} players checked in")
+        if checked_in != len(all_players):
+            self.log(f"❌ Expected {len(all_players)} players checked in, got {checked_in}")
+            return None
+        self.log(f"✅ {checked_in} players checked in")
         
         # Start the game
         start_success, _ = self.test_start_game(league_id)
         if not start_success:
-            print("❌ Failed to start the game")
-            return False
-        
-        print("✅ Game started successfully")
+            self.log("❌ Failed to start the game")
+            return None
         
-        # 7. TEST REAL-TIME ELIMINATIONS - Players get eliminated one by one
-        print("\n--- TESTING REAL-TIME ELIMINATIONS ---")
-        
-        # Player 1 gets eliminated in 5th place (last place)
-        login_success, _ = self.test_login_user(test_users[0].get('email'))
-        if login_success:
-            elimination_success, elimination_response = self.test_player_checkin(
-                league_id, action="check_out", finish_position=5
-            )
-            if elimination_success:
-                print(f"✅ Player 1 eliminated in 5th place")
-                print(f"   Points earned: {elimination_response.get('points_earned', 0)}")
-                print(f"   Earnings: ${elimination_response.get('earnings', 0)}")
-            else:
-                print("❌ Failed to eliminate player 1")
-                return False
+        self.log("✅ Game started successfully")
+        return admin, test_users, league_id
+
+    # Complete Flow Test
+    @fail_fast
+    def test_real_time_score_logging_flow(self):
+        """Test the NEW Real-Time Score Logging feature"""
+        self.log("\n=== TESTING REAL-TIME SCORE LOGGING FLOW ===")
         
-        # Player 2 gets eliminated in 4th place
-        login_success, _ = self.test_login_user(test_users[1].get('email'))
-        if login_success:
-            elimination_success, elimination_response = self.test_player_checkin(
-                league_id, action="check_out", finish_position=4
-            )
-            if elimination_success:
-                print(f"✅ Player 2 eliminated in 4th place")
-                print(f"   Points earned: {elimination_response.get('points_earned', 0)}")
-                print(f"   Earnings: ${elimination_response.get('earnings', 0)}")
-            else:
-                print("❌ Failed to eliminate player 2")
-                return False
+        # 1-6. Register the admin and 4 players, create the league, check everyone in and start
+        setup = self._setup_league_with_players(4)
+        if not setup:
+            return False
+        admin, test_users, league_id = setup
+        admin_email = admin.get('email')
         
-        # Player 3 gets eliminated in 3rd place
-        login_success, _ = self.test_login_user(test_users[2].get('email'))
-        if login_success:
-            elimination_success, elimination_response = self.test_player_checkin(
-                league_id, action="check_out", finish_position=3
-            )
-            if elimination_success:
-                print(f"✅ Player 3 eliminated in 3rd place")
-                print(f"   Points earned: {elimination_response.get('points_earned', 0)}")
-                print(f"   Earnings: ${elimination_response.get('earnings', 0)}")
-            else:
-                print("❌ Failed to eliminate player 3")
-                return False
+        # Log in once to cover the login endpoint; identity swaps after this use switch_user
+        login_success, _ = self.test_login_user(admin_email)
+        if not login_success:
+            self.log("❌ Failed to log in admin user")
+            return False
         
-        # Player 4 gets eliminated in 2nd place
-        login_success, _ = self.test_login_user(test_users[3].get('email'))
-        if login_success:
-            elimination_success, elimination_response = self.test_player_checkin(
-                league_id, action="check_out", finish_position=2
-            )
-            if elimination_success:
-                print(f"✅ Player 4 eliminated in 2nd place")
-                print(f"   Points earned: {elimination_response.get('points_earned', 0)}")
-                print(f"   Earnings: ${elimination_response.get('earnings', 0)}")
-            else:
-                print("❌ Failed to eliminate player 4")
-                return False
+        # 7. TEST REAL-TIME ELIMINATIONS - Players get eliminated one by one
+        self.log("\n--- TESTING REAL-TIME ELIMINATIONS ---")
         
-        # Admin wins (1st place) - eliminate themselves
-        login_success, _ = self.test_login_user(admin_email)
-        if login_success:
-            elimination_success, elimination_response = self.test_player_checkin(
-                league_id, action="check_out", finish_position=1
-            )
-            if elimination_success:
-                print(f"✅ Admin wins in 1st place")
-                print(f"   Points earned: {elimination_response.get('points_earned', 0)}")
-                print(f"   Earnings: ${elimination_response.get('earnings', 0)}")
-            else:
-                print("❌ Failed to eliminate admin (winner)")
-                return False
+        # Collect every elimination first, then dispatch them together with each player's stored token
+        eliminations = [(user, 5 - i) for i, user in enumerate(test_users)] + [(admin, 1)]
+        if not all(success for _, success in self.test_batch_eliminations(league_id, eliminations)):
+            return False
         
         # 8. Check game status to verify live eliminations
-        print("\n--- VERIFYING LIVE ELIMINATIONS ---")
+        self.log("\n--- VERIFYING LIVE ELIMINATIONS ---")
         _, final_game_status = self.test_get_game_status(league_id)
         if final_game_status:
             live_eliminations = final_game_status.get('live_eliminations', [])
-            print(f"✅ Found {len(live_eliminations)} live eliminations")
+            self.log(f"✅ Found {len(live_eliminations)} live eliminations")
             
             # Verify all positions are recorded
-            positions = [e.get('finish_position') for e in live_eliminations]
-            expected_positions = [1, 2, 3, 4, 5]
+            count = len(live_eliminations)
+            positions = np.fromiter((e.get('finish_position', 0) for e in live_eliminations), dtype=np.int32, count=count)
+            points = np.fromiter((e.get('points_earned', 0) for e in live_eliminations), dtype=np.int32, count=count)
+            expected_positions = np.arange(1, 6, dtype=np.int32)
             
-            if sorted(positions) == expected_positions:
-                print("✅ All finish positions recorded correctly")
+            if np.array_equal(np.sort(positions), expected_positions):
+                self.log("✅ All finish positions recorded correctly")
             else:
-                print(f"❌ Expected positions {expected_positions}, got {sorted(positions)}")
+                self.log(f"❌ Expected positions {expected_positions.tolist()}, got {sorted(positions.tolist())}")
                 return False
             
-            # Verify points calculation
             for elimination in live_eliminations:
-                pos = elimination.get('finish_position')
-                points = elimination.get('points_earned')
-                print(f"   Position {pos}: {elimination.get('user_name')} - {points} points")
-                
-                # Verify points match expected calculation
-                expected_points = 100 if pos == 1 else 80 if pos == 2 else 60 if pos == 3 else 40 if pos <= 5 else 20
-                if points != expected_points:
-                    print(f"❌ Expected {expected_points} points for position {pos}, got {points}")
-                    return False
+                self.log(f"   Position {elimination.get('finish_position')}: {elimination.get('user_name')} - {elimination.get('points_earned')} points")
+            
+            # Verify points match expected calculation, for every elimination in one comparison
+            expected_points = _EXPECTED_POINTS_TABLE[np.clip(positions, 0, len(_EXPECTED_POINTS_TABLE) - 1)]
+            mismatches = np.flatnonzero(points != expected_points)
+            if mismatches.size:
+                i = mismatches[0]
+                self.log(f"❌ Expected {expected_points[i]} points for position {positions[i]}, got {points[i]}")
+                return False
             
-            print("✅ All points calculated correctly")
+            self.log("✅ All points calculated correctly")
             
             # Verify eliminated count
             eliminated_count = final_game_status.get('eliminated_count', 0)
             if eliminated_count == 5:
-                print("✅ Eliminated count is correct")
+                self.log("✅ Eliminated count is correct")
             else:
-                print(f"❌ Expected 5 eliminated players, got {eliminated_count}")
+                self.log(f"❌ Expected 5 eliminated players, got {eliminated_count}")
                 return False
             
             # Verify active players count (should be 0 now)
             active_count = final_game_status.get('checked_in_players', 0)
             if active_count == 0:
-                print("✅ No active players remaining")
+                self.log("✅ No active players remaining")
             else:
-                print(f"❌ Expected 0 active players, got {active_count}")
+                self.log(f"❌ Expected 0 active players, got {active_count}")
                 return False
         
         # 9. Check leaderboard to verify real-time updates
-        print("\n--- VERIFYING LEADERBOARD UPDATES ---")
+        self.log("\n--- VERIFYING LEADERBOARD UPDATES ---")
         leaderboard_success, leaderboard = self.test_get_league_leaderboard(league_id)
         if not leaderboard_success:
-            print("❌ Failed to get league leaderboard")
+            self.log("❌ Failed to get league leaderboard")
             return False
         
         if len(leaderboard) != 5:
-            print(f"❌ Expected 5 players on leaderboard, got {len(leaderboard)}")
+            self.log(f"❌ Expected 5 players on leaderboard, got {len(leaderboard)}")
             return False
         else:
-            print(f"✅ Leaderboard has correct number of players: {len(leaderboard)}")
+            self.log(f"✅ Leaderboard has correct number of players: {len(leaderboard)}")
         
         # Verify winner is at top
         winner = leaderboard[0]
         if winner.get('user_name') == admin.get('name'):
-            print(f"✅ Winner {winner.get('user_name')} is at top of leaderboard")
-            print(f"   Points: {winner.get('total_points')}")
-            print(f"   Earnings: ${winner.get('total_earnings')}")
+            self.log(f"✅ Winner {winner.get('user_name')} is at top of leaderboard")
+            self.log(f"   Points: {winner.get('total_points')}")
+            self.log(f"   Earnings: ${winner.get('total_earnings')}")
         else:
-            print(f"❌ Expected {admin.get('name')} at top, got {winner.get('user_name')}")
+            self.log(f"❌ Expected {admin.get('name')} at top, got {winner.get('user_name')}")
             return False
         
         # 10. Test error handling - try to use duplicate position
-        print("\n--- TESTING ERROR HANDLING ---")
+        self.log("\n--- TESTING ERROR HANDLING ---")
         
         # Reset game first
         reset_success, _ = self.test_reset_game(league_id)
         if not reset_success:
-            print("❌ Failed to reset game for error testing")
+            self.log("❌ Failed to reset game for error testing")
             return False
         
         # Check in 2 players and start game
-        for user in [admin, test_users[0]]:
-            login_success, _ = self.test_login_user(user.get('email'))
-            if login_success:
-                self.test_player_checkin(league_id)
+        self.check_in_players(league_id, [admin, test_users[0]])
         
         # Start game as admin
-        login_success, _ = self.test_login_user(admin_email)
-        if login_success:
-            self.test_start_game(league_id)
+        self.switch_user(admin_email)
+        self.test_start_game(league_id)
         
         # First player eliminates in 2nd place
-        login_success, _ = self.test_login_user(test_users[0].get('email'))
-        if login_success:
-            self.test_player_checkin(league_id, action="check_out", finish_position=2)
+        self.switch_user(test_users[0].get('email'))
+        self.test_player_checkin(league_id, action="check_out", finish_position=2)
         
         # Try to eliminate admin in same position (should fail)
-        login_success, _ = self.test_login_user(admin_email)
-        if login_success:
-            # This should fail because position 2 is already taken
-            duplicate_success, _ = self.run_test(
-                "Duplicate Position Test (should fail)",
-                "POST",
-                f"api/game/{league_id}/checkin",
-                400,  # Expecting error
-                data={
-                    "league_id": league_id,
-                    "action": "check_out",
-                    "finish_position": 2
-                },
-                auth=True
-            )
-            
-            if duplicate_success:
-                print("✅ Duplicate position correctly rejected")
-            else:
-                print("❌ Duplicate position should have been rejected")
+        self.switch_user(admin_email)
+        # This should fail because position 2 is already taken
+        duplicate_success, _ = self.run_test(
+            "Duplicate Position Test (should fail)",
+            "POST",
+            f"api/game/{league_id}/checkin",
+            400,  # Expecting error
+            data={
+                "league_id": league_id,
+                "action": "check_out",
+                "finish_position": 2
+            },
+            auth=True
+        )
         
-        print("✅ Real-time score logging flow test completed successfully!")
+        if duplicate_success:
+            self.log("✅ Duplicate position correctly rejected")
+        else:
+            self.log("❌ Duplicate position should have been rejected")
+        
+        self.log("✅ Real-time score logging flow test completed successfully!")
         return True
 
     # Complete Flow Test
+    @fail_fast
     def test_complete_tournament_flow(self):
         """Test the complete tournament flow from registration to leaderboard"""
-        print("\n=== TESTING COMPLETE TOURNAMENT FLOW ===")
-        
-        # 1. Register admin user
-        admin_success, admin = self.test_register_user()
-        if not admin_success:
-            print("❌ Failed to register admin user")
-            return False
-        
-        admin_id = admin.get('id')
-        admin_email = admin.get('email')
-        
-        # 2. Create a league
-        league_success, league_id = self.test_create_league(buy_in=100)
-        if not league_success or not league_id:
-            print("❌ Failed to create league")
-            return False
-        
-        self.test_league = league_id
-        
-        # 3. Register 5 more test users
-        test_users = []
-        for i in range(5):
-            # Save admin token
-            admin_token = self.token
-            
-            # Register new user
-            user_success, user = self.test_register_user()
-            if user_success and user:
-                test_users.append(user)
-                
-                # Join the league with this user
-                join_success, _ = self.test_join_league(league_id)
-                if not join_success:
-                    print(f"❌ Failed to join league for user {user.get('name')}")
-            
-            # Restore admin token
-            self.token = admin_token
-            self.user = admin
-        
-        self.test_users = test_users
-        
-        if len(test_users) < 3:
-            print("❌ Failed to create enough test users")
-            return False
-        
-        print(f"✅ Created {len(test_users)} test users who joined the league")
-        
-        # 4. First get game status to initialize the game
-        _, game_status = self.test_get_game_status(league_id)
-        if not game_status:
-            print("❌ Failed to get initial game status")
-            return False
-            
-        print("✅ Game initialized successfully")
-        
-        # 5. Check-in all users (admin + test users)
-        for user in [admin] + test_users:
-            # Login as this user
-            login_success, _ = self.test_login_user(user.get('email'))
-            if login_success:
-                # Check in
-                checkin_success, _ = self.test_player_checkin(league_id)
-                if not checkin_success:
-                    print(f"❌ Failed to check in user {user.get('name')}")
-                else:
-                    print(f"✅ Checked in user {user.get('name')}")
-        
-        # 6. Login as admin and start the game
-        login_success, _ = self.test_login_user(admin_email)
-        if not login_success:
-            print("❌ Failed to log back in as admin")
-            return False
-        
-        # Get game status to verify check-ins
-        _, game_status = self.test_get_game_status(league_id)
-        checked_in = game_status.get('checked_in_players', 0)
-        print(f"✅ {checked_in} players checked in")
+        self.log("\n=== TESTING COMPLETE TOURNAMENT FLOW ===")
         
-        # Start the game
-        start_success, _ = self.test_start_game(league_id)
-        if not start_success:
-            print("❌ Failed to start the game")
+        # 1-6. Register the admin and 5 players, create the league, check everyone in and start
+        setup = self._setup_league_with_players(5)
+        if not setup:
             return False
-        
-        print("✅ Game started successfully")
+        admin, test_users, league_id = setup
         
         # 7. Complete the game with results
         all_players = [admin] + test_users
         # Shuffle players to randomize finish positions
         random.shuffle(all_players)
         
-        results = []
-        for i, player in enumerate(all_players):
-            results.append({
+        results = [
+            {
                 "user_id": player.get('id'),
                 "user_name": player.get('name'),
                 "finish_position": i + 1,
                 "points_earned": 0,  # Will be calculated by backend
                 "buy_in_paid": 100
-            })
+            }
+            for i, player in enumerate(all_players)
+        ]
         
         complete_success, _ = self.test_complete_game(league_id, results)
         if not complete_success:
-            print("❌ Failed to complete the game")
+            self.log("❌ Failed to complete the game")
             return False
         
-        print("✅ Game completed successfully with results")
+        self.log("✅ Game completed successfully with results")
+        
+        # 8-10. The verification GETs are independent, so fetch them concurrently and check in order
+        winner_id = results[0]["user_id"]
+        league_leaderboard = self._pool.submit(self.test_get_league_leaderboard, league_id)
+        overall_leaderboard = self._pool.submit(self.test_get_overall_leaderboard)
+        winner_stats = self._pool.submit(self.test_get_user_stats, winner_id)
         
         # 8. Check leaderboard
-        leaderboard_success, leaderboard = self.test_get_league_leaderboard(league_id)
+        leaderboard_success, leaderboard = league_leaderboard.result()
         if not leaderboard_success:
-            print("❌ Failed to get league leaderboard")
+            self.log("❌ Failed to get league leaderboard")
             return False
         
         if len(leaderboard) != len(all_players):
-            print(f"❌ Expected {len(all_players)} players on leaderboard, got {len(leaderboard)}")
+            self.log(f"❌ Expected {len(all_players)} players on leaderboard, got {len(leaderboard)}")
         else:
-            print(f"✅ Leaderboard has correct number of players: {len(leaderboard)}")
+            self.log(f"✅ Leaderboard has correct number of players: {len(leaderboard)}")
         
         # 9. Check overall leaderboard
-        overall_success, _ = self.test_get_overall_leaderboard()
+        overall_success, _ = overall_leaderboard.result()
         if not overall_success:
-            print("❌ Failed to get overall leaderboard")
+            self.log("❌ Failed to get overall leaderboard")
             return False
         
         # 10. Check user stats for winner
-        winner_id = results[0]["user_id"]
-        stats_success, stats = self.test_get_user_stats(winner_id)
+        stats_success, stats = winner_stats.result()
         if not stats_success:
-            print("❌ Failed to get user stats")
+            self.log("❌ Failed to get user stats")
             return False
         
         # Verify winner has correct stats
         user_stats = stats.get('stats', {})
         if user_stats.get('total_games', 0) != 1:
-            print(f"❌ Expected winner to have 1 game, got {user_stats.get('total_games', 0)}")
+            self.log(f"❌ Expected winner to have 1 game, got {user_stats.get('total_games', 0)}")
         else:
-            print("✅ Winner has correct game count")
+            self.log("✅ Winner has correct game count")
         
         if user_stats.get('total_wins', 0) != 1:
-            print(f"❌ Expected winner to have 1 win, got {user_stats.get('total_wins', 0)}")
+            self.log(f"❌ Expected winner to have 1 win, got {user_stats.get('total_wins', 0)}")
         else:
-            print("✅ Winner has correct win count")
+            self.log("✅ Winner has correct win count")
         
         if user_stats.get('win_rate', 0) != 100.0:
-            print(f"❌ Expected winner to have 100% win rate, got {user_stats.get('win_rate', 0)}%")
+            self.log(f"❌ Expected winner to have 100% win rate, got {user_stats.get('win_rate', 0)}%")
         else:
-            print("✅ Winner has correct win rate")
+            self.log("✅ Winner has correct win rate")
         
         # 11. Reset the game
         reset_success, _ = self.test_reset_game(league_id)
         if not reset_success:
-            print("❌ Failed to reset the game")
+            self.log("❌ Failed to reset the game")
             return False
         
-        print("✅ Game reset successfully")
-        print("✅ Complete tournament flow test passed!")
+        self.log("✅ Game reset successfully")
+        self.log("✅ Complete tournament flow test passed!")
         return True
 
 def main():
@@ -787,18 +901,41 @@ def main():
     
     print(f"Testing against backend URL: {backend_url}")
     
-    # Setup
-    tester = PokerLeagueAPITester(backend_url)
+    # Setup; -v prints progress as it happens instead of after the run
+    # -x stops each flow at its first failed call
+    verbose = '-v' in sys.argv[1:] or '--verbose' in sys.argv[1:]
+    strict = '-x' in sys.argv[1:] or '--strict' in sys.argv[1:]
+    
+    # Each flow registers its own users and league, so they run side by side on separate testers
+    flows = [
+        "test_real_time_score_logging_flow",  # The NEW Real-Time Score Logging feature
+        "test_complete_tournament_flow",
+    ]
+    testers = [PokerLeagueAPITester(backend_url, verbose=verbose, strict=strict) for _ in flows]
+    for tester in testers:
+        tester.warm_up()
     
     # Run tests
     print("\n=== POKER LEAGUE API TESTS ===")
     
-    # Test the NEW Real-Time Score Logging feature
-    tester.test_real_time_score_logging_flow()
+    with ThreadPoolExecutor(max_workers=len(flows)) as pool:
+        futures = [pool.submit(getattr(tester, flow)) for tester, flow in zip(testers, flows)]
+        try:
+            # Each tester's buffered log prints as one block, so the flows' output doesn't interleave
+            results = [future.result() for future in futures]
+        finally:
+            for tester in testers:
+                tester.flush_log()
     
     # Print results
-    print(f"\n📊 Tests passed: {tester.tests_passed}/{tester.tests_run}")
-    return 0 if tester.tests_passed == tester.tests_run else 1
+    tests_run = sum(tester.tests_run for tester in testers)
+    tests_passed = sum(tester.tests_passed for tester in testers)
+    print(f"\n📊 Tests passed: {tests_passed}/{tests_run}")
+    print(f"🗄️  Cached GET responses reused: {sum(tester.cache_hits for tester in testers)}")
+    print(f"🏷️  Conditional GETs answered 304: {sum(tester.not_modified for tester in testers)}")
+    for tester in testers:
+        tester.close()
+    return 0 if all(results) and tests_passed == tests_run else 1
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -750,11 +750,33 @@ const GameInterface = ({ league, onBack }) => {
   const { user, token } = useAuth();
 
   useEffect(() => {
-    fetchGameStatus();
-    const interval = setInterval(fetchGameStatus, 3000);
-    return () => clearInterval(interval);
+    // The server pushes status changes over a WebSocket; poll only if the socket closes on us
+    // (1008 lost membership/auth, 1011 server error, or no WebSocket support on the way)
+    let interval = null;
+    let unmounted = false;
+    const socket = new WebSocket(
+      `${BACKEND_URL.replace(/^http/, 'ws')}/api/ws/game/${league.id}?token=${encodeURIComponent(token)}`
+    );
+    socket.onmessage = (event) => applyGameStatus(JSON.parse(event.data));
+    socket.onclose = () => {
+      if (!unmounted && interval === null) {
+        fetchGameStatus();
+        interval = setInterval(fetchGameStatus, 3000);
+      }
+    };
+    return () => {
+      unmounted = true;
+      socket.close();
+      if (interval !== null) clearInterval(interval);
+    };
   }, []);
 
+  const applyGameStatus = (data) => {
+    setGameStatus(data);
+    setCheckedInUsers(new Set(data.seat_assignments.map(a => a.user_id)));
+    setLoading(false);
+  };
+
   const fetchGameStatus = async () => {
     try {
       const response = await fetch(`${BACKEND_URL}/api/game/${league.id}/status`, {
@@ -762,10 +784,7 @@ const GameInterface = ({ league, onBack }) => {
       });
       
       if (response.ok) {
-        const data = await response.json();
-        setGameStatus(data);
-        setCheckedInUsers(new Set(data.seat_assignments.map(a => a.user_id)));
-        setLoading(false);
+        applyGameStatus(await response.json());
       }
     } catch (error) {
       console.error('Error fetching game status:', error);
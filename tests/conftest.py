@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+COLLECTIONS = ("users", "leagues", "memberships", "games", "game_results", "leaderboard")
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """Point every server collection at a fresh in-memory Mongo (mongomock-motor)"""
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    import server
+
+    db = mongomock_motor.AsyncMongoMockClient()["poker_league_test"]
+    for name in COLLECTIONS:
+        monkeypatch.setattr(server, f"{name}_collection", db[name])
+    monkeypatch.setattr(server, "_unenforced_constraints", {})
+    return db
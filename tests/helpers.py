@@ -0,0 +1,52 @@
+"""
+Game flows for the mongomock tests, driven through the route handlers.
+"""
+import asyncio
+import uuid
+
+import server
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def create_league(db, players, buy_in=100):
+    """Insert the users, a league they all belong to and a started game; returns (league_id, users)"""
+    league_id = uuid.uuid4().hex
+    users = [
+        {"id": uuid.uuid4().hex, "email": f"{name.lower()}@example.com", "name": name, "avatar": "🃏"}
+        for name in players
+    ]
+    await db.users.insert_many([dict(user) for user in users])
+    await db.leagues.insert_one({"id": league_id, "admin_id": users[0]["id"], "buy_in": buy_in})
+    await db.memberships.insert_many([
+        {"league_id": league_id, "user_id": user["id"], "status": "approved"} for user in users
+    ])
+    await start_game(league_id, users)
+    return league_id, users
+
+
+async def start_game(league_id, users):
+    await server.get_or_create_active_game(league_id)
+    for user in users:
+        await server.handle_checkin(
+            league_id, server.CheckInRequest(league_id=league_id, action="check_in"), current_user=user
+        )
+    await server.start_game(league_id, current_user=users[0])
+
+
+async def eliminate(league_id, user, finish_position):
+    request = server.CheckInRequest(league_id=league_id, action="check_out", finish_position=finish_position)
+    return await server.handle_checkin(league_id, request, current_user=user)
+
+
+async def complete(league_id, admin, finishers):
+    submission = server.GameResultSubmission(results=[
+        server.GameResult(
+            user_id=user["id"], user_name=user["name"], finish_position=position,
+            points_earned=0, buy_in_paid=100
+        )
+        for position, user in enumerate(finishers, start=1)
+    ])
+    return await server.complete_game(league_id, submission, current_user=admin)
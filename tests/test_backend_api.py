@@ -0,0 +1,38 @@
+"""
+Pytest entry point for the live API flows in backend_test.py.
+
+Each flow registers its own users and league, so the cases are independent and
+pytest-xdist can spread them across workers:
+
+    REACT_APP_BACKEND_URL=https://... pytest -n auto tests/
+"""
+import os
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from backend_test import PokerLeagueAPITester
+
+BACKEND_URL = os.environ.get("REACT_APP_BACKEND_URL")
+
+pytestmark = pytest.mark.skipif(not BACKEND_URL, reason="REACT_APP_BACKEND_URL is not set")
+
+
+@pytest.fixture
+def tester():
+    # strict stops a flow at its first failed call, so the flush below ends at the failure
+    with PokerLeagueAPITester(BACKEND_URL, strict=True) as tester:
+        tester.warm_up()
+        yield tester
+        # pytest captures this and only shows it for failing flows
+        tester.flush_log()
+
+
+@pytest.mark.parametrize("flow", [
+    "test_real_time_score_logging_flow",
+    "test_complete_tournament_flow",
+])
+def test_api_flow(tester, flow):
+    assert getattr(tester, flow)(), f"{flow} reported a failure"
+    assert tester.tests_passed == tester.tests_run, f"{tester.tests_run - tester.tests_passed} API calls failed"
@@ -0,0 +1,115 @@
+"""
+Elimination races that the per-worker lock can't see, against an in-memory Mongo.
+
+Another worker's write is simulated by making handle_checkin's precheck read stale
+data, so only the Mongo-side guards stand between the request and a bad write.
+"""
+import pytest
+from fastapi import HTTPException
+
+pytest.importorskip("mongomock_motor")
+
+import server  # noqa: E402
+from tests.helpers import create_league, eliminate, run  # noqa: E402
+
+
+def stale_first_read(monkeypatch, collection, stale):
+    """Answer the next find_one on collection with stale, as if another worker wrote right after it"""
+    find_one = collection.find_one
+    reads = []
+
+    def patched(*args, **kwargs):
+        if not reads:
+            reads.append(args)
+            return _result(stale)
+        return find_one(*args, **kwargs)
+
+    monkeypatch.setattr(collection, "find_one", patched)
+
+
+async def _result(value):
+    return value
+
+
+async def active_game(db, league_id):
+    return await db.games.find_one({"league_id": league_id, "status": "active"}, {"_id": 0})
+
+
+def test_taken_position_puts_the_player_back_at_the_table(db, monkeypatch):
+    async def scenario():
+        await server._ensure_unique_finish_position_index()
+        league_id, users = await create_league(db, ["Ann", "Bob", "Cat"])
+        ann, bob, cat = users
+        await eliminate(league_id, cat, 3)
+
+        # Bob's precheck misses Cat's result, so the unique index is what refuses position 3
+        stale_first_read(monkeypatch, server.game_results_collection, None)
+        with pytest.raises(HTTPException) as taken:
+            await eliminate(league_id, bob, 3)
+        assert taken.value.status_code == 400
+        assert taken.value.detail == "Position #3 is already taken by Cat"
+
+        game = await active_game(db, league_id)
+        assert game["eliminated_users"] == [cat["id"]]
+        assert await db.game_results.count_documents({"game_id": game["id"]}) == 1
+
+        # Rolled back, so Bob can still be knocked out at the next position
+        await eliminate(league_id, bob, 2)
+        game = await active_game(db, league_id)
+        assert sorted(game["eliminated_users"]) == sorted([cat["id"], bob["id"]])
+
+    run(scenario())
+
+
+def test_player_cannot_be_eliminated_twice(db, monkeypatch):
+    async def scenario():
+        league_id, users = await create_league(db, ["Ann", "Bob", "Cat"])
+        cat = users[2]
+        before = await active_game(db, league_id)
+        await eliminate(league_id, cat, 3)
+
+        # The second request read the game before Cat's elimination landed
+        stale_first_read(monkeypatch, server.games_collection, before)
+        with pytest.raises(HTTPException) as repeated:
+            await eliminate(league_id, cat, 2)
+        assert repeated.value.detail == "Player is already eliminated"
+        assert await db.game_results.count_documents({"user_id": cat["id"]}) == 1
+
+    run(scenario())
+
+
+def test_duplicate_active_games_are_completed_before_indexing(db):
+    async def scenario():
+        await db.games.insert_many([
+            {"id": "older", "league_id": "l1", "status": "active", "created_at": 1},
+            {"id": "newer", "league_id": "l1", "status": "active", "created_at": 2},
+            {"id": "other", "league_id": "l2", "status": "active", "created_at": 1},
+        ])
+        await server._ensure_one_active_game_per_league()
+
+        active = await db.games.find({"status": "active"}, {"_id": 0, "id": 1}).to_list(None)
+        assert sorted(game["id"] for game in active) == ["newer", "other"]
+        # mongomock ignores partialFilterExpression, so the index build itself isn't checked here
+
+    run(scenario())
+
+
+def test_unenforceable_finish_positions_report_degraded_health(db):
+    async def scenario():
+        await db.game_results.insert_many([
+            {"game_id": "g1", "finish_position": 1, "user_id": "ann"},
+            {"game_id": "g1", "finish_position": 1, "user_id": "bob"},
+        ])
+        await server._ensure_unique_finish_position_index()
+
+        # The lookups still get their index, just not a unique one
+        index = (await db.game_results.index_information())["game_id_1_finish_position_1"]
+        assert not index.get("unique")
+        response = await server.health()
+        assert response.status_code == 503
+        assert b"game_id_1_finish_position_1" in response.body
+
+        server._unenforced_constraints.clear()
+        assert await server.health() == {"status": "ok"}
+
+    run(scenario())
@@ -0,0 +1,37 @@
+"""Conditional GETs on the game status: If-None-Match parsing in etag_json_response."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+import server  # noqa: E402
+
+PAYLOAD = {"game_id": "g1", "checked_in_players": 3}
+
+
+@pytest.fixture
+def etag():
+    return server.etag_json_response(PAYLOAD).headers["ETag"]
+
+
+@pytest.mark.parametrize("header", [
+    "{etag}",
+    "W/{etag}",
+    '"stale", {etag}',
+    '"stale",W/{etag}',
+    "*",
+])
+def test_matching_validators_get_304(etag, header):
+    response = server.etag_json_response(PAYLOAD, header.format(etag=etag))
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert not response.body
+
+
+@pytest.mark.parametrize("header", [None, "", '"stale"', 'W/"stale", "other"'])
+def test_other_validators_get_the_body(header):
+    response = server.etag_json_response(PAYLOAD, header)
+    assert response.status_code == 200
+    assert response.body
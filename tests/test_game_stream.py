@@ -0,0 +1,104 @@
+"""
+The /api/ws/game feed: one status build per league change, fanned out to every socket.
+
+Auth and the status builders are stubbed, so this runs without Mongo.
+"""
+import os
+import sys
+from collections import defaultdict
+
+import pytest
+
+pytest.importorskip("httpx")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+import server  # noqa: E402
+from fastapi import HTTPException, WebSocketDisconnect  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+LEAGUE_ID = "league-1"
+
+
+@pytest.fixture
+def feed(monkeypatch):
+    state = {"version": 0, "members": {"ann", "bob"}, "builds": 0, "error": None}
+
+    async def resolve_user(token):
+        return {"id": token}
+
+    def payload():
+        return {"version": state["version"], "league_members": [{"id": user_id} for user_id in sorted(state["members"])]}
+
+    async def build_game_status(league_id, user_id):
+        if user_id not in state["members"]:
+            raise HTTPException(status_code=403, detail="Not a member of this league")
+        return payload()
+
+    async def build_league_game_status(league_id):
+        state["builds"] += 1
+        if state["error"]:
+            raise state["error"]
+        return payload()
+
+    monkeypatch.setattr(server, "resolve_user", resolve_user)
+    monkeypatch.setattr(server, "build_game_status", build_game_status)
+    monkeypatch.setattr(server, "build_league_game_status", build_league_game_status)
+    # Each TestClient runs its own event loop, so start every test with no feeds
+    monkeypatch.setattr(server, "_game_sockets", defaultdict(dict))
+    monkeypatch.setattr(server, "_game_changed", {})
+    monkeypatch.setattr(server, "_game_feeds", {})
+    # Startup would index and backfill a real database
+    monkeypatch.setattr(server.app.router, "on_startup", [])
+    with TestClient(server.app) as client:
+        state["client"] = client
+        yield state
+
+
+def connect(feed, user_id):
+    return feed["client"].websocket_connect(f"/api/ws/game/{LEAGUE_ID}?token={user_id}")
+
+
+def change(feed, **updates):
+    feed.update(updates)
+    feed["client"].portal.call(server._notify_game_subscribers, LEAGUE_ID)
+
+
+def test_one_build_per_change_for_every_socket(feed):
+    with connect(feed, "ann") as ann, connect(feed, "bob") as bob:
+        assert ann.receive_json()["version"] == 0
+        assert bob.receive_json()["version"] == 0
+
+        change(feed, version=1)
+        assert ann.receive_json()["version"] == 1
+        assert bob.receive_json()["version"] == 1
+        assert feed["builds"] == 1
+
+
+def test_non_members_are_refused_and_revoked_members_closed(feed):
+    with pytest.raises(WebSocketDisconnect) as refused:
+        with connect(feed, "cat") as cat:
+            cat.receive_json()
+    assert refused.value.code == 1008
+
+    with connect(feed, "ann") as ann, connect(feed, "bob") as bob:
+        ann.receive_json()
+        bob.receive_json()
+
+        change(feed, version=1, members={"ann"})
+        assert ann.receive_json()["version"] == 1
+        with pytest.raises(WebSocketDisconnect) as revoked:
+            bob.receive_json()
+        assert revoked.value.code == 1008
+
+
+def test_failed_build_closes_every_socket(feed):
+    with connect(feed, "ann") as ann, connect(feed, "bob") as bob:
+        ann.receive_json()
+        bob.receive_json()
+
+        change(feed, error=RuntimeError("mongo timeout"))
+        for websocket in (ann, bob):
+            with pytest.raises(WebSocketDisconnect) as closed:
+                websocket.receive_json()
+            assert closed.value.code == 1011
@@ -0,0 +1,160 @@
+"""
+Materialized leaderboard checks against an in-memory Mongo (mongomock-motor).
+
+The leaderboard collection is kept up to date by refresh_leaderboard after each
+elimination and completion; these pin it to what the original on-the-fly
+aggregation over game_results returned, including after complete_game replaces
+the live elimination results.
+"""
+import asyncio
+import uuid
+
+import pytest
+
+pytest.importorskip("mongomock_motor")
+
+import server  # noqa: E402
+from tests.helpers import complete, create_league, eliminate, run, start_game  # noqa: E402
+
+
+async def baseline(db, league_id=None):
+    """Per-user standings computed straight from game_results, as the pre-materialized endpoint did"""
+    query = {"league_id": league_id} if league_id else {}
+    totals = {}
+    for result in await db.game_results.find(query).to_list(None):
+        row = totals.setdefault(result["user_id"], {"points": 0, "games": 0, "wins": 0, "finishes": 0, "earnings": 0})
+        row["points"] += result["points_earned"]
+        row["games"] += 1
+        row["wins"] += result["finish_position"] == 1
+        row["finishes"] += result["finish_position"]
+        row["earnings"] += result["earnings"]
+    return {
+        user_id: (
+            row["points"], row["games"], row["wins"],
+            round(row["wins"] / row["games"] * 100, 1), round(row["finishes"] / row["games"], 1),
+            row["earnings"]
+        )
+        for user_id, row in totals.items()
+    }
+
+
+async def materialized(league_id=None):
+    entries = await server.calculate_leaderboard(league_id)
+    points = [entry.total_points for entry in entries]
+    assert points == sorted(points, reverse=True)
+    assert [entry.rank for entry in entries] == list(range(1, len(entries) + 1))
+    return {
+        entry.user_id: (
+            entry.total_points, entry.games_played, entry.wins,
+            entry.win_rate, entry.avg_finish, entry.total_earnings
+        )
+        for entry in entries
+    }
+
+
+async def assert_matches_baseline(db, *league_ids):
+    assert await materialized() == await baseline(db)
+    for league_id in league_ids:
+        assert await materialized(league_id) == await baseline(db, league_id)
+
+
+def test_eliminations_refresh_both_scopes(db):
+    async def scenario():
+        league_id, users = await create_league(db, ["Ann", "Bob", "Cat", "Dan"])
+        for position, user in zip((4, 3, 2, 1), users[::-1]):
+            await eliminate(league_id, user, position)
+
+        await assert_matches_baseline(db, league_id)
+        league_rows = await materialized(league_id)
+        assert set(league_rows) == {user["id"] for user in users}
+        assert all(row[1] == 1 for row in league_rows.values())
+
+        entries = await server.calculate_leaderboard(league_id)
+        assert entries[0].user_id == users[0]["id"]
+        assert entries[0].user_avatar == "🃏"
+
+    run(scenario())
+
+
+def test_complete_game_replaces_live_results_without_double_counting(db):
+    async def scenario():
+        league_id, users = await create_league(db, ["Ann", "Bob", "Cat", "Dan"])
+        ann, bob, cat, dan = users
+        # Dan and Cat are knocked out live, then the admin submits final results that leave Dan out
+        await eliminate(league_id, dan, 4)
+        await eliminate(league_id, cat, 3)
+        await complete(league_id, ann, [bob, ann, cat])
+
+        await assert_matches_baseline(db, league_id)
+        for scope in (None, league_id):
+            rows = await materialized(scope)
+            # Stale rows go: Dan has no results left in this game
+            assert dan["id"] not in rows
+            # Cat's live result was replaced, not added to
+            assert rows[cat["id"]][1] == 1
+            assert rows[bob["id"]][2] == 1
+
+    run(scenario())
+
+
+def test_scopes_stay_separate_across_leagues(db):
+    async def scenario():
+        first_league, first_users = await create_league(db, ["Ann", "Bob", "Cat"])
+        await complete(first_league, first_users[0], first_users)
+
+        # The same players also play in a second league
+        second_league = uuid.uuid4().hex
+        await db.leagues.insert_one({"id": second_league, "admin_id": first_users[1]["id"], "buy_in": 50})
+        await db.memberships.insert_many([
+            {"league_id": second_league, "user_id": user["id"], "status": "approved"} for user in first_users
+        ])
+        await start_game(second_league, first_users[1:] + first_users[:1])
+        await complete(second_league, first_users[1], first_users[::-1])
+
+        await assert_matches_baseline(db, first_league, second_league)
+        assert all(row[1] == 2 for row in (await materialized()).values())
+
+    run(scenario())
+
+
+def test_rebuild_and_backfill_match_incremental_rows(db):
+    async def scenario():
+        league_id, users = await create_league(db, ["Ann", "Bob", "Cat"])
+        await eliminate(league_id, users[2], 3)
+        await complete(league_id, users[0], users)
+        incremental = await materialized(league_id), await materialized()
+
+        await db.leaderboard.insert_one({"scope": league_id, "user_id": "gone", "total_points": 0})
+        await server.rebuild_leaderboard()
+        assert (await materialized(league_id), await materialized()) == incremental
+
+        # Backfill only runs when the collection is empty
+        await db.leaderboard.delete_many({})
+        await server.backfill_leaderboard()
+        assert (await materialized(league_id), await materialized()) == incremental
+
+    run(scenario())
+
+
+def test_scheduled_rebuild_heals_stale_and_partial_rows(db, monkeypatch):
+    async def scenario():
+        league_id, users = await create_league(db, ["Ann", "Bob", "Cat"])
+        await complete(league_id, users[0], users)
+
+        # A racing refresh wrote an old global row, a backfill stopped before this league's
+        # rows, and a league with no results left still has one
+        await db.leaderboard.update_one(
+            {"scope": server.LEADERBOARD_GLOBAL_SCOPE, "user_id": users[0]["id"]}, {"$set": {"total_points": 0}}
+        )
+        await db.leaderboard.delete_many({"scope": league_id})
+        await db.leaderboard.insert_one({"scope": "deleted-league", "user_id": users[1]["id"], "total_points": 5})
+
+        monkeypatch.setattr(server, "LEADERBOARD_REBUILD_SECONDS", 0.01)
+        rebuilder = asyncio.create_task(server._rebuild_leaderboard_periodically())
+        await asyncio.sleep(0.1)
+        rebuilder.cancel()
+
+        await assert_matches_baseline(db, league_id)
+        assert await db.leaderboard.count_documents({"scope": "deleted-league"}) == 0
+
+    run(scenario())